@@ -1,4 +1,6 @@
 class FinancialBase:
+    __slots__ = ("manager_id", "name", "department", "budget", "expenses", "revenue")
+
     def __init__(self, manager_id, name, department):
         # Initialize financial base attributes
         self.manager_id = manager_id
@@ -14,9 +16,15 @@ class FinancialBase:
     
     def record_expense(self, amount, description):
         # Record an expense and deduct from budget
-        if amount <= self.budget:
+        budget = self.budget
+        if amount <= budget:
             self.expenses += amount
-            self.budget -= amount
+            self.budget = budget - amount
+
+    def _record_expense_unchecked(self, amount):
+        # Record an already-validated expense; used by trusted internal callers
+        self.expenses += amount
+        self.budget -= amount
     
     def record_revenue(self, amount, source):
         # Record revenue and add to budget
@@ -25,46 +33,56 @@ class FinancialBase:
 
 
 class FinancialManager(FinancialBase):
+    __slots__ = ("salaries", "tax_rate", "insurance_costs", "_cached_taxes", "_taxes_revenue", "_taxes_rate")
+
     def __init__(self, manager_id, name, department):
         # Initialize financial manager with additional attributes
         super().__init__(manager_id, name, department)
         self.salaries = {}
         self.tax_rate = 0.15
         self.insurance_costs = 0.0
+        # Last computed taxes and the revenue/rate they were computed from
+        self._cached_taxes = 0.0
+        self._taxes_revenue = None
+        self._taxes_rate = None
     
     def add_salary(self, employee_id, amount):
         # Add salary for an employee
         self.salaries[employee_id] = amount
     
     def calculate_taxes(self):
-        # Calculate taxes based on revenue
-        return self.revenue * self.tax_rate
+        # Calculate taxes based on revenue, reusing the cached value while revenue and rate are unchanged
+        revenue = self.revenue
+        tax_rate = self.tax_rate
+        if revenue != self._taxes_revenue or tax_rate != self._taxes_rate:
+            self._cached_taxes = revenue * tax_rate
+            self._taxes_revenue = revenue
+            self._taxes_rate = tax_rate
+        return self._cached_taxes
     
     def add_insurance_cost(self, amount):
-        # Add insurance cost and include in expenses
+        # Add insurance cost and book it as an expense against the budget
         self.insurance_costs += amount
-        self.expenses += amount
+        self._record_expense_unchecked(amount)
     
     def record_expense(self, amount, description):
         # Override: Validate and record expense
-        try:
-            if amount < 0:
-                raise ValueError("Invalid expense amount!")
-            super().record_expense(amount, description)
-        except ValueError as e:
-            print(f"Error recording expense: {e}")
+        if amount < 0:
+            print("Error recording expense: Invalid expense amount!")
+            return
+        super().record_expense(amount, description)
     
     def record_revenue(self, amount, source):
         # Override: Validate and record revenue
-        try:
-            if amount < 0:
-                raise ValueError("Invalid revenue amount!")
-            super().record_revenue(amount, source)
-        except ValueError as e:
-            print(f"Error recording revenue: {e}")
+        if amount < 0:
+            print("Error recording revenue: Invalid revenue amount!")
+            return
+        super().record_revenue(amount, source)
 
 
 class Invoice:
+    __slots__ = ("invoice_id", "customer", "vehicle", "amount", "status")
+
     def __init__(self, invoice_id, customer, vehicle, amount):
         # Initialize invoice details
         self.invoice_id = invoice_id
@@ -83,15 +101,18 @@ class Invoice:
 
 
 class FinancialReport:
+    __slots__ = ("financial_manager",)
+
     def __init__(self, financial_manager):
         # Initialize financial report with a financial manager instance
         self.financial_manager = financial_manager
     
     def generate_report(self):
         # Generate and return financial report details
-        net_profit = self.financial_manager.revenue - self.financial_manager.expenses
-        taxes = self.financial_manager.calculate_taxes()
+        fm = self.financial_manager
+        revenue = fm.revenue
+        expenses = fm.expenses
         return (f"Financial Report\n"
-                f"Manager: {self.financial_manager.name}, Department: {self.financial_manager.department}\n"
-                f"Budget: ${self.financial_manager.budget}, Expenses: ${self.financial_manager.expenses}, Revenue: ${self.financial_manager.revenue}\n"
-                f"Net Profit: ${net_profit}, Taxes: ${taxes}, Insurance Costs: ${self.financial_manager.insurance_costs}")
+                f"Manager: {fm.name}, Department: {fm.department}\n"
+                f"Budget: ${fm.budget}, Expenses: ${expenses}, Revenue: ${revenue}\n"
+                f"Net Profit: ${revenue - expenses}, Taxes: ${fm.calculate_taxes()}, Insurance Costs: ${fm.insurance_costs}")
@@ -1,109 +1,158 @@
+import numbers
+import sys
+from collections import Counter, deque
+from functools import lru_cache
+from types import MappingProxyType
+from weakref import WeakSet
+
+# Reach multiplier per campaign strategy; anything else falls back to the default
+_CAMPAIGN_MULTIPLIERS = MappingProxyType({
+    "Social Media": 75,
+    "TV Ads": 120,
+    "Billboards": 50,
+    "Email Marketing": 40
+})
+_DEFAULT_MULTIPLIER = 60
+
+# Delivery lead time in days per car model; unlisted models take the default.
+# Model names are interned so lookups with interned keys compare by identity.
+_DELIVERY_DAYS = MappingProxyType({
+    sys.intern("Tesla Model S"): 3,
+    sys.intern("BMW i8"): 4
+})
+_DEFAULT_DELIVERY_DAYS = 5
+
+# Buffered stock notifications kept per store or distributor; older ones are dropped if nobody flushes
+_EVENT_BUFFER = 1000
+
+# Reverse index of car model -> distributors currently holding it in stock.
+# Weak sets so the index never keeps a distributor alive; a model's entry goes once no one holds it.
+_AVAILABILITY = {}
+
+
+@lru_cache(maxsize=128)
+def _trend_for(reach):
+    # Classify market trend from campaign reach
+    if reach > 100000:
+        return "High Demand"
+    if reach > 50000:
+        return "Stable Market"
+    return "Low Interest"
+
+
 # Marketing Class: Handles marketing strategies and campaigns
 class Marketing:
     def __init__(self, strategy, budget):
-        self.__strategy = strategy  
-        self.__budget = budget  
-        self.__reach = 0  
+        self._strategy = strategy  
+        self._budget = budget  
+        self._reach = 0  
 
     def run_campaign(self):
-        multipliers = {
-            "Social Media": 75,
-            "TV Ads": 120,
-            "Billboards": 50,
-            "Email Marketing": 40
-        }
-        try:
-            if self.__strategy in multipliers:
-                self.__reach = self.__budget * multipliers[self.__strategy]
-            else:
-                self.__reach = self.__budget * 60
-            print(f"Running a {self.__strategy} campaign with a budget of ${self.__budget}. Estimated reach: {self.__reach} people.")
-        except TypeError as e:
-            print(f"[Type Error in campaign]: {e}")
-        except Exception as e:
-            print(f"[Unknown error in campaign]: {e}")
+        # numbers.Number admits Decimal and Fraction budgets but still rejects strings, which would multiply
+        if not isinstance(self._budget, numbers.Number):
+            print(f"[Type Error in campaign]: budget must be a number, got {type(self._budget).__name__}")
+            return
+        self._reach = self._budget * _CAMPAIGN_MULTIPLIERS.get(self._strategy, _DEFAULT_MULTIPLIER)
+        print(f"Running a {self._strategy} campaign with a budget of ${self._budget}. Estimated reach: {self._reach} people.")
 
     def analyze_market(self):
-        try:
-            if self.__reach > 100000:
-                trend = "High Demand"
-            elif self.__reach > 50000:
-                trend = "Stable Market"
-            else:
-                trend = "Low Interest"
-            print(f"Market Analysis: Based on campaign reach, current trend is {trend}.")
-            return trend
-        except AttributeError as e:
-            print(f"[Attribute Error in analysis]: {e}")
-            return None
-        except Exception as e:
-            print(f"[Unknown error in analysis]: {e}")
-            return None
+        trend = _trend_for(self._reach)
+        print(f"Market Analysis: Based on campaign reach, current trend is {trend}.")
+        return trend
 
 
 # Base Class for Stores
 class Store:
-    def __init__(self, store_id, name, location):
-        self.__store_id = store_id
-        self.__name = name
-        self.__location = location
-        self.__stock = []
+    __slots__ = ("_store_id", "_name", "_location", "_stock", "_verbose", "_events")
+
+    def __init__(self, store_id, name, location, verbose=False):
+        self._store_id = store_id
+        self._name = name
+        self._location = location
+        self._stock = Counter()
+        # Stock notifications are buffered here unless verbose printing is on
+        self._verbose = verbose
+        self._events = deque(maxlen=_EVENT_BUFFER)
+
+    def _log(self, message):
+        if self._verbose:
+            print(message)
+        else:
+            self._events.append(message)
+
+    def flush_events(self):
+        if self._events:
+            sys.stdout.write("\n".join(self._events) + "\n")
+            self._events.clear()
 
     def add_car(self, car):
-        try:
-            self.__stock.append(car)
-            print(f"Added {car} to {self.__name} store.")
-        except AttributeError as e:
-            print(f"[Attribute Error adding car]: {e}")
-        except Exception as e:
-            print(f"[Unknown error adding car]: {e}")
+        car = sys.intern(car)
+        self._stock[car] += 1
+        self._log(f"Added {car} to {self._name} store.")
+
+    def add_cars(self, car, quantity):
+        car = sys.intern(car)
+        self._stock[car] += quantity
+        self._log(f"Added {quantity} x {car} to {self._name} store.")
 
     def sell_car(self, car):
-        try:
-            if car in self.__stock:
-                self.__stock.remove(car)
-                print(f"Sold {car} from {self.__name} store.")
-            else:
-                raise ValueError(f"{car} is not available in {self.__name} store.")
-        except ValueError as e:
-            print(f"[Value Error selling car]: {e}")
-        except Exception as e:
-            print(f"[Unknown error selling car]: {e}")
+        stock = self._stock
+        count = stock.get(car, 0)
+        if not count:
+            print(f"{car} is not available in {self._name} store.")
+            return False
+        if count > 1:
+            stock[car] = count - 1
+        else:
+            del stock[car]
+        self._log(f"Sold {car} from {self._name} store.")
+        return True
 
     def check_stock(self):
-        return len(self.__stock)
+        return sum(self._stock.values())
+
+    @property
+    def name(self):
+        return self._name
+
+    @property
+    def stock(self):
+        return self._stock
 
     def get_name(self):
-        return self.__name
+        return self._name
 
     def get_stock(self):
-        return self.__stock
+        return self._stock
+
+    def get_models(self):
+        return list(self._stock)
 
 
 # CarStore Class: Represents a car dealership
 class CarStore(Store):
+    __slots__ = ()
+
     def purchase_from_retailer(self, retailer, car):
-        try:
-            if car in retailer.get_stock():
-                retailer.sell_car(car)
-                self.add_car(car)
-                print(f"{self.get_name()} purchased {car} from {retailer.get_name()}.")
-            else:
-                raise ValueError(f"{car} is not available at {retailer.get_name()}.")
-        except ValueError as e:
-            print(f"[Value Error purchasing car]: {e}")
-        except Exception as e:
-            print(f"[Unknown error purchasing car]: {e}")
+        if retailer.stock.get(car, 0) <= 0:
+            print(f"{car} is not available at {retailer.name}.")
+            return False
+        retailer.sell_car(car)
+        self.add_car(car)
+        print(f"{self.name} purchased {car} from {retailer.name}.")
+        return True
 
 
 # Retailer Class
 class Retailer(Store):
-    def __init__(self, retailer_id, name, location):
-        super().__init__(retailer_id, name, location)
+    __slots__ = ()
+
+    def __init__(self, retailer_id, name, location, verbose=False):
+        super().__init__(retailer_id, name, location, verbose)
 
     def order_product(self, distributor, car, quantity):
         try:
-            print(f"Retailer {self.get_name()} ordering {quantity} of {car} from Distributor {distributor.get_name()}.")
+            print(f"Retailer {self.name} ordering {quantity} of {car} from Distributor {distributor.name}.")
             order_id = distributor.generate_order_id()
             order = Order(order_id, car, quantity, 100000)  # Added default price_per_unit
             order.place_order()
@@ -117,91 +166,133 @@ class Retailer(Store):
     def receive_product(self, car):
         self.add_car(car)
 
+    def receive_products(self, car, quantity):
+        self.add_cars(car, quantity)
+
     def sell_product(self, car):
         self.sell_car(car)
 
     def check_stock(self):
-        try:
-            stock = self.get_stock()
-            print(f"Available cars in {self.get_name()}: {len(stock)}")
-            return stock
-        except AttributeError as e:
-            print(f"[Attribute Error checking stock]: {e}")
-            return []
-        except Exception as e:
-            print(f"[Unknown error checking stock]: {e}")
-            return []
+        print(f"Available cars in {self.name}: {super().check_stock()}")
+        return self.stock
 
     def return_car(self, distributor, car):
-        try:
-            if car in self.get_stock():
-                self.sell_car(car)
-                distributor.add_to_inventory(car)
-                print(f"{car} returned to Distributor {distributor.get_name()}.")
-            else:
-                raise ValueError(f"{car} is not available for return in {self.get_name()} store.")
-        except ValueError as e:
-            print(f"[Value Error returning car]: {e}")
-        except Exception as e:
-            print(f"[Unknown error returning car]: {e}")
+        if self.stock.get(car, 0) <= 0:
+            print(f"{car} is not available for return in {self.name} store.")
+            return False
+        self.sell_car(car)
+        distributor.add_to_inventory(car)
+        print(f"{car} returned to Distributor {distributor.name}.")
+        return True
 
 
 # Distributor Class
 class Distributor:
-    def __init__(self, distributor_id, name, distribution_network=None):
-        self.__distributor_id = distributor_id
-        self.__name = name
-        self.__distribution_network = distribution_network
-        self.__inventory = []
-        self.__order_count = 0
+    __slots__ = ("_distributor_id", "_name", "_distribution_network", "_inventory", "_order_count",
+                 "_verbose", "_events", "__weakref__")
+
+    def __init__(self, distributor_id, name, distribution_network=None, verbose=False):
+        self._distributor_id = distributor_id
+        self._name = name
+        self._distribution_network = distribution_network
+        self._inventory = Counter()
+        self._order_count = 0
+        # Inventory notifications are buffered here unless verbose printing is on
+        self._verbose = verbose
+        self._events = deque(maxlen=_EVENT_BUFFER)
+
+    def _log(self, message):
+        if self._verbose:
+            print(message)
+        else:
+            self._events.append(message)
+
+    def flush_events(self):
+        if self._events:
+            sys.stdout.write("\n".join(self._events) + "\n")
+            self._events.clear()
 
     def add_to_inventory(self, car):
-        try:
-            self.__inventory.append(car)
-            print(f"Added {car} to Distributor {self.__name}'s inventory.")
-        except AttributeError as e:
-            print(f"[Attribute Error adding to inventory]: {e}")
-        except Exception as e:
-            print(f"[Unknown error adding to inventory]: {e}")
+        car = sys.intern(car)
+        self._inventory[car] += 1
+        _AVAILABILITY.setdefault(car, WeakSet()).add(self)
+        self._log(f"Added {car} to Distributor {self._name}'s inventory.")
+
+    def add_many(self, car, quantity):
+        car = sys.intern(car)
+        self._inventory[car] += quantity
+        _AVAILABILITY.setdefault(car, WeakSet()).add(self)
+        self._log(f"Added {quantity} x {car} to Distributor {self._name}'s inventory.")
 
     def distribute_product(self, retailer, car, quantity, order):
-        try:
-            available_quantity = self.__inventory.count(car)
-            if available_quantity >= quantity:
-                for _ in range(quantity):
-                    self.__inventory.remove(car)
-                    retailer.receive_product(car)
-                order.update_order_status("Shipped")
-                print(f"Distributed {quantity} of {car} to Retailer {retailer.get_name()}.")
-            else:
-                print(f"Not enough {car} in Distributor {self.__name}'s inventory.")
-                order.update_order_status("Cancelled")
-        except ValueError as e:
-            print(f"[Value Error distributing product]: {e}")
-        except Exception as e:
-            print(f"[Unknown error distributing product]: {e}")
+        car = sys.intern(car)
+        inventory = self._inventory
+        available_quantity = inventory.get(car, 0)
+        if available_quantity < quantity:
+            self._log(f"Not enough {car} in Distributor {self._name}'s inventory.")
+            order.update_order_status("Cancelled")
+            return False
+        remaining = available_quantity - quantity
+        if remaining:
+            inventory[car] = remaining
+        else:
+            inventory.pop(car, None)
+            holders = _AVAILABILITY.get(car)
+            if holders is not None:
+                holders.discard(self)
+                if not holders:
+                    del _AVAILABILITY[car]
+        retailer.receive_products(car, quantity)
+        order.update_order_status("Shipped")
+        self._log(f"Distributed {quantity} of {car} to Retailer {retailer.name}.")
+        return True
+
+    def check_inventory(self):
+        inventory = self._inventory
+        if not inventory:
+            print(f"Distributor {self._name}'s inventory is empty.")
+            return
+        lines = [f"Current Inventory of Distributor {self._name}:"]
+        lines.extend(f"- {car}: {quantity} units" for car, quantity in inventory.items())
+        print("\n".join(lines))
 
     def get_distributor_info(self):
         return {
-            "ID": self.__distributor_id,
-            "Name": self.__name,
-            "Network": self.__distribution_network,
-            "Inventory": self.__inventory
+            "ID": self._distributor_id,
+            "Name": self._name,
+            "Network": self._distribution_network,
+            "Inventory": self._inventory
         }
 
+    @property
+    def name(self):
+        return self._name
+
     def get_name(self):
-        return self.__name
+        return self._name
+
+    @staticmethod
+    def find_with(car):
+        holders = _AVAILABILITY.get(car)
+        if holders is None:
+            return frozenset()
+        if not holders:
+            # Every holder has been garbage-collected
+            del _AVAILABILITY[car]
+        return frozenset(holders)
 
     def generate_order_id(self):
-        self.__order_count += 1
-        return self.__order_count
+        self._order_count += 1
+        return self._order_count
 
 
 # Order Class
 class Order:
+    __slots__ = ("order_id", "product", "quantity", "price_per_unit", "status", "date", "estimated_delivery_days")
+
     def __init__(self, order_id, product, quantity, price_per_unit):
         self.order_id = order_id
-        self.product = product
+        self.product = sys.intern(product)
         self.quantity = quantity
         self.price_per_unit = price_per_unit
         self.status = "Pending"
@@ -222,45 +313,42 @@ class Order:
         return self.quantity * self.price_per_unit
 
     def calculate_delivery_time(self):
-        if self.product == "Tesla Model S":
-            return 3
-        elif self.product == "BMW i8":
-            return 4
-        else:
-            return 5
+        return _DELIVERY_DAYS.get(self.product, _DEFAULT_DELIVERY_DAYS)
 
 
 # Test system
-marketing = Marketing("Social Media", 5000)
-marketing.run_campaign()
-market_trend = marketing.analyze_market()
+try:
+    marketing = Marketing("Social Media", 5000)
+    marketing.run_campaign()
+    market_trend = marketing.analyze_market()
 
-distributor = Distributor(101, "Auto Distributors", ["North Egypt", "Delta"])
-retailer = Retailer(201, "City Cars", "Cairo")
-car_store = CarStore(301, "Elite Motors", "Alexandria")
+    distributor = Distributor(101, "Auto Distributors", ["North Egypt", "Delta"], verbose=True)
+    retailer = Retailer(201, "City Cars", "Cairo", verbose=True)
+    car_store = CarStore(301, "Elite Motors", "Alexandria", verbose=True)
 
-distributor.add_to_inventory("Tesla Model S")
-distributor.add_to_inventory("Tesla Model S")
-distributor.add_to_inventory("BMW i8")
+    distributor.add_many("Tesla Model S", 2)
+    distributor.add_many("BMW i8", 1)
 
-order1 = retailer.order_product(distributor, "Tesla Model S", 2)
-order1.track_order()
-print(f"Total price: {order1.calculate_total_price()} EGP")
+    order1 = retailer.order_product(distributor, "Tesla Model S", 2)
+    order1.track_order()
+    print(f"Total price: {order1.calculate_total_price()} EGP")
 
-order2 = retailer.order_product(distributor, "BMW i8", 1)
-order2.track_order()
-print(f"Total price: {order2.calculate_total_price()} EGP")
+    order2 = retailer.order_product(distributor, "BMW i8", 1)
+    order2.track_order()
+    print(f"Total price: {order2.calculate_total_price()} EGP")
 
-order3 = retailer.order_product(distributor, "Audi A6", 1)
-order3.track_order()
-print(f"Total price: {order3.calculate_total_price()} EGP")
+    order3 = retailer.order_product(distributor, "Audi A6", 1)
+    order3.track_order()
+    print(f"Total price: {order3.calculate_total_price()} EGP")
 
-retailer.check_stock()
+    retailer.check_stock()
 
-retailer.sell_product("Tesla Model S")
-retailer.check_stock()
+    retailer.sell_product("Tesla Model S")
+    retailer.check_stock()
 
-retailer.return_car(distributor, "BMW i8")
+    retailer.return_car(distributor, "BMW i8")
 
-car_store.purchase_from_retailer(retailer, "Tesla Model S")
-print(f"{car_store.get_name()} stock: {car_store.check_stock()} cars available.")
+    car_store.purchase_from_retailer(retailer, "Tesla Model S")
+    print(f"{car_store.name} stock: {car_store.check_stock()} cars available.")
+except Exception as e:
+    print(f"[Unknown error in test system]: {e}")
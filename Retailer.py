@@ -1,44 +1,81 @@
+import itertools
+import queue
 import sqlite3
-from icecream import ic as print
+import threading
+from contextlib import contextmanager
 
 # Global variable to track login status
 current_user = None
 
+# SQL for the hot write paths, kept as constants so every call reuses the cached prepared statement
+SQL_INSERT_ORDER = "INSERT INTO orders (product_id, retailer_id, quantity, status) VALUES (?, ?, ?, 'pending')"
+# Availability check and decrement in one statement; rowcount is 0 when stock is short or not offered
+SQL_RESERVE_INVENTORY = (
+    "UPDATE inventory SET quantity = quantity - ? WHERE id = ? AND available_for_retailer = 1 AND quantity >= ?"
+)
+# Adds a product or, when the name is already listed, adds to its quantity and updates the price
+SQL_UPSERT_INVENTORY = (
+    "INSERT INTO inventory (product_name, quantity, price, available_for_retailer) VALUES (?, ?, ?, 1) "
+    "ON CONFLICT(product_name) DO UPDATE SET quantity = quantity + excluded.quantity, price = excluded.price"
+)
+SQL_FULFILL_ORDER = "UPDATE orders SET status = 'fulfilled', distributor_id = ? WHERE id = ?"
+SQL_PENDING_ORDER_IDS = "SELECT id FROM orders WHERE status = 'pending' AND id IN ({})"
+SQL_INSERT_PRODUCTION = (
+    "INSERT INTO manufacturer_inventory (product_name, quantity, cost, available_for_distributor) VALUES (?, ?, ?, 1)"
+)
+SQL_PENDING_MANUFACTURER_ORDERS = (
+    "SELECT o.id, p.product_name, o.quantity, d.name AS distributor_name FROM manufacturer_orders o "
+    "JOIN manufacturer_inventory p ON o.product_id = p.id "
+    "JOIN users d ON o.distributor_id = d.id "
+    "WHERE o.status = 'pending'"
+)
+SQL_FULFILL_MANUFACTURER_ORDER = "UPDATE manufacturer_orders SET status = 'fulfilled', manufacturer_id = ? WHERE id = ?"
+# Chosen pending orders joined with their product's current stock, so availability is settled in one pass
+SQL_PENDING_MANUFACTURER_ORDERS_BY_ID = (
+    "SELECT o.id, o.product_id, o.quantity, p.quantity AS stock FROM manufacturer_orders o "
+    "JOIN manufacturer_inventory p ON o.product_id = p.id "
+    "WHERE o.status = 'pending' AND o.id IN ({})"
+)
+SQL_DECREMENT_MANUFACTURER_INVENTORY = "UPDATE manufacturer_inventory SET quantity = quantity - ? WHERE id = ?"
+
+SQL_LOGIN = "SELECT id, username, name, role FROM users WHERE username = ? AND password = ?"
+
+def parse_order_ids(text):
+    """Parse a comma-separated list of order IDs"""
+    return [int(part) for part in text.split(",") if part.strip()]
+
+def report_fulfillment(order_ids, fulfilled):
+    if fulfilled:
+        print(f"Fulfilled orders: {', '.join(map(str, fulfilled))}")
+    skipped = [order_id for order_id in order_ids if order_id not in fulfilled]
+    if skipped:
+        print(f"Could not fulfill orders: {', '.join(map(str, skipped))}")
+
 class Retailer:
-    def __init__(self, connection, user_id):
-        self.conn = connection
+    def __init__(self, pool, user_id):
+        self.pool = pool
         self.user_id = user_id
         
     def view_inventory(self):
         """View available inventory from distributors"""
-        query = "SELECT * FROM inventory WHERE available_for_retailer = 1"
-        items = self.conn.execute(query).fetchall()
-        print("\nAvailable Inventory:")
-        for item in items:
-            print(f"ID: {item[0]}, Product: {item[1]}, Quantity: {item[2]}, Price: {item[3]}")
+        query = "SELECT id, product_name, quantity, price FROM inventory WHERE available_for_retailer = 1"
+        with self.pool.reader() as conn:
+            items = conn.execute(query).fetchall()
+        lines = ["\nAvailable Inventory:"]
+        lines.extend(
+            f"ID: {item['id']}, Product: {item['product_name']}, Quantity: {item['quantity']}, Price: {item['price']}"
+            for item in items
+        )
+        print("\n".join(lines))
         return items
         
     def place_order(self, product_id, quantity):
         """Place an order with distributors"""
         try:
-            with self.conn:
-                # Check availability
-                available = self.conn.execute(
-                    "SELECT quantity FROM inventory WHERE id = ? AND available_for_retailer = 1",
-                    (product_id,)
-                ).fetchone()
-                
-                if available and available[0] >= quantity:
-                    # Create order
-                    self.conn.execute(
-                        "INSERT INTO orders (product_id, retailer_id, quantity, status) VALUES (?, ?, ?, 'pending')",
-                        (product_id, self.user_id, quantity)
-                    )
-                    # Update inventory
-                    self.conn.execute(
-                        "UPDATE inventory SET quantity = quantity - ? WHERE id = ?",
-                        (quantity, product_id)
-                    )
+            with self.pool.writer() as conn:
+                # Reserve stock and create the order in the same transaction
+                if conn.execute(SQL_RESERVE_INVENTORY, (quantity, product_id, quantity)).rowcount:
+                    conn.execute(SQL_INSERT_ORDER, (product_id, self.user_id, quantity))
                     print(f"Order placed successfully for {quantity} units")
                 else:
                     print("Insufficient inventory or product not available")
@@ -46,86 +83,75 @@ class Retailer:
             print(f"Error placing order: {e}")
 
 class Distributor:
-    def __init__(self, connection, user_id):
-        self.conn = connection
+    def __init__(self, pool, user_id):
+        self.pool = pool
         self.user_id = user_id
         
     def view_manufacturer_inventory(self):
         """View inventory from manufacturers"""
-        query = "SELECT * FROM manufacturer_inventory WHERE available_for_distributor = 1"
-        items = self.conn.execute(query).fetchall()
-        print("\nManufacturer Inventory:")
-        for item in items:
-            print(f"ID: {item[0]}, Product: {item[1]}, Quantity: {item[2]}, Price: {item[3]}")
+        query = "SELECT id, product_name, quantity, cost FROM manufacturer_inventory WHERE available_for_distributor = 1"
+        with self.pool.reader() as conn:
+            items = conn.execute(query).fetchall()
+        lines = ["\nManufacturer Inventory:"]
+        lines.extend(
+            f"ID: {item['id']}, Product: {item['product_name']}, Quantity: {item['quantity']}, Price: {item['cost']}"
+            for item in items
+        )
+        print("\n".join(lines))
         return items
         
     def fulfill_retailer_orders(self):
         """View and fulfill retailer orders"""
-        orders = self.conn.execute(
-            "SELECT o.id, p.name, o.quantity, r.name FROM orders o "
-            "JOIN products p ON o.product_id = p.id "
-            "JOIN users r ON o.retailer_id = r.id "
-            "WHERE o.status = 'pending'"
-        ).fetchall()
+        with self.pool.reader() as conn:
+            orders = conn.execute(
+                "SELECT o.id, p.product_name, o.quantity, r.name AS retailer_name FROM orders o "
+                "JOIN inventory p ON o.product_id = p.id "
+                "JOIN users r ON o.retailer_id = r.id "
+                "WHERE o.status = 'pending'"
+            ).fetchall()
         
-        print("\nPending Orders:")
-        for order in orders:
-            print(f"Order ID: {order[0]}, Product: {order[1]}, Quantity: {order[2]}, Retailer: {order[3]}")
+        lines = ["\nPending Orders:"]
+        lines.extend(
+            f"Order ID: {order['id']}, Product: {order['product_name']}, Quantity: {order['quantity']}, "
+            f"Retailer: {order['retailer_name']}"
+            for order in orders
+        )
+        print("\n".join(lines))
             
-        order_id = input("Enter order ID to fulfill (or 0 to cancel): ")
-        if order_id != '0':
+        order_ids = input("Enter order IDs to fulfill, comma-separated (or 0 to cancel): ")
+        if order_ids.strip() != '0':
             try:
-                with self.conn:
-                    self.conn.execute(
-                        "UPDATE orders SET status = 'fulfilled', distributor_id = ? WHERE id = ?",
-                        (self.user_id, order_id)
-                    )
-                    print("Order fulfilled successfully")
+                ids = parse_order_ids(order_ids)
+                report_fulfillment(ids, self.fulfill_orders_bulk(ids))
             except Exception as e:
                 print(f"Error fulfilling order: {e}")
+
+    def fulfill_orders_bulk(self, order_ids):
+        """Fulfill several pending retailer orders in one transaction and return the fulfilled IDs"""
+        if not order_ids:
+            return []
+        with self.pool.writer() as conn:
+            query = SQL_PENDING_ORDER_IDS.format(",".join("?" * len(order_ids)))
+            fulfilled = [row['id'] for row in conn.execute(query, order_ids)]
+            conn.executemany(SQL_FULFILL_ORDER, [(self.user_id, order_id) for order_id in fulfilled])
+        return fulfilled
                 
     def manage_inventory(self):
-        """Add or update inventory for retailers"""
-        print("\n1. Add new inventory\n2. Update existing inventory")
-        choice = input("Select option: ")
+        """Add inventory for retailers, or update it if the product is already listed"""
+        product_name = input("Enter product name: ")
+        quantity = int(input("Enter quantity: "))
+        price = float(input("Enter price: "))
         
-        if choice == '1':
-            product_name = input("Enter product name: ")
-            quantity = int(input("Enter quantity: "))
-            price = float(input("Enter price: "))
-            
-            try:
-                with self.conn:
-                    self.conn.execute(
-                        "INSERT INTO inventory (product_name, quantity, price, available_for_retailer) VALUES (?, ?, ?, 1)",
-                        (product_name, quantity, price)
-                    )
-                    print("Inventory added successfully")
-            except Exception as e:
-                print(f"Error adding inventory: {e}")
-                
-        elif choice == '2':
-            items = self.conn.execute("SELECT id, product_name FROM inventory").fetchall()
-            for item in items:
-                print(f"ID: {item[0]}, Product: {item[1]}")
-                
-            item_id = input("Enter item ID to update: ")
-            quantity = int(input("Enter new quantity: "))
-            price = float(input("Enter new price: "))
-            
-            try:
-                with self.conn:
-                    self.conn.execute(
-                        "UPDATE inventory SET quantity = ?, price = ? WHERE id = ?",
-                        (quantity, price, item_id)
-                    )
-                    print("Inventory updated successfully")
-            except Exception as e:
-                print(f"Error updating inventory: {e}")
+        try:
+            with self.pool.writer() as conn:
+                conn.execute(SQL_UPSERT_INVENTORY, (product_name, quantity, price))
+                print("Inventory saved successfully")
+        except Exception as e:
+            print(f"Error saving inventory: {e}")
 
 class Manufacturer:
-    def __init__(self, connection, user_id):
-        self.conn = connection
+    def __init__(self, pool, user_id):
+        self.pool = pool
         self.user_id = user_id
         
     def produce_goods(self):
@@ -135,78 +161,71 @@ class Manufacturer:
         cost = float(input("Enter production cost per unit: "))
         
         try:
-            with self.conn:
-                self.conn.execute(
-                    "INSERT INTO manufacturer_inventory (product_name, quantity, cost, available_for_distributor) VALUES (?, ?, ?, 1)",
-                    (product_name, quantity, cost)
-                )
+            with self.pool.writer() as conn:
+                conn.execute(SQL_INSERT_PRODUCTION, (product_name, quantity, cost))
                 print("Production recorded successfully")
         except Exception as e:
             print(f"Error recording production: {e}")
             
     def view_distributor_orders(self):
         """View orders from distributors"""
-        orders = self.conn.execute(
-            "SELECT o.id, p.name, o.quantity, d.name FROM manufacturer_orders o "
-            "JOIN manufacturer_inventory p ON o.product_id = p.id "
-            "JOIN users d ON o.distributor_id = d.id "
-            "WHERE o.status = 'pending'"
-        ).fetchall()
+        with self.pool.reader() as conn:
+            orders = conn.execute(SQL_PENDING_MANUFACTURER_ORDERS).fetchall()
         
-        print("\nPending Distributor Orders:")
-        for order in orders:
-            print(f"Order ID: {order[0]}, Product: {order[1]}, Quantity: {order[2]}, Distributor: {order[3]}")
+        lines = ["\nPending Distributor Orders:"]
+        lines.extend(
+            f"Order ID: {order['id']}, Product: {order['product_name']}, Quantity: {order['quantity']}, "
+            f"Distributor: {order['distributor_name']}"
+            for order in orders
+        )
+        print("\n".join(lines))
             
-        order_id = input("Enter order ID to fulfill (or 0 to cancel): ")
-        if order_id != '0':
+        order_ids = input("Enter order IDs to fulfill, comma-separated (or 0 to cancel): ")
+        if order_ids.strip() != '0':
             try:
-                with self.conn:
-                    # Check inventory
-                    product_id, quantity = self.conn.execute(
-                        "SELECT product_id, quantity FROM manufacturer_orders WHERE id = ?",
-                        (order_id,)
-                    ).fetchone()
-                    
-                    available = self.conn.execute(
-                        "SELECT quantity FROM manufacturer_inventory WHERE id = ?",
-                        (product_id,)
-                    ).fetchone()
-                    
-                    if available and available[0] >= quantity:
-                        self.conn.execute(
-                            "UPDATE manufacturer_orders SET status = 'fulfilled', manufacturer_id = ? WHERE id = ?",
-                            (self.user_id, order_id)
-                        )
-                        self.conn.execute(
-                            "UPDATE manufacturer_inventory SET quantity = quantity - ? WHERE id = ?",
-                            (quantity, product_id)
-                        )
-                        print("Order fulfilled successfully")
-                    else:
-                        print("Insufficient inventory to fulfill order")
+                ids = parse_order_ids(order_ids)
+                report_fulfillment(ids, self.fulfill_orders_bulk(ids))
             except Exception as e:
                 print(f"Error fulfilling order: {e}")
-                
 
+    def fulfill_orders_bulk(self, order_ids):
+        """Fulfill several pending distributor orders in one transaction and return the fulfilled IDs"""
+        if not order_ids:
+            return []
+        with self.pool.writer() as conn:
+            # The stock is read under the write lock, so it stays current while orders are matched against it
+            query = SQL_PENDING_MANUFACTURER_ORDERS_BY_ID.format(",".join("?" * len(order_ids)))
+            stock = {}
+            taken = {}
+            fulfilled = []
+            for order in conn.execute(query, order_ids):
+                # Orders whose stock ran short are left pending
+                product_id, quantity = order['product_id'], order['quantity']
+                available = stock.setdefault(product_id, order['stock'])
+                if quantity <= available:
+                    stock[product_id] = available - quantity
+                    taken[product_id] = taken.get(product_id, 0) + quantity
+                    fulfilled.append(order['id'])
+            conn.executemany(SQL_DECREMENT_MANUFACTURER_INVENTORY,
+                             [(quantity, product_id) for product_id, quantity in taken.items()])
+            conn.executemany(SQL_FULFILL_MANUFACTURER_ORDER, [(self.user_id, order_id) for order_id in fulfilled])
+        return fulfilled
 
-def login(connection):
+
+def login(pool):
     global current_user
     print("\n--- Supply Chain Login ---")
     username = input("Username: ")
     password = input("Password: ")  # In production, use hashed passwords
     
-    user = connection.execute(
-        "SELECT id, username, name, role FROM users WHERE username = ? AND password = ?",
-        (username, password)
-    ).fetchone()
+    with pool.reader() as conn:
+        user = conn.execute(
+            SQL_LOGIN,
+            (username, password)
+        ).fetchone()
     
     if user:
-        current_user = {
-            'id': user[0],
-            'username': user[1],
-            'name': user[2],
-            'role': user[3]
-        }
+        current_user = dict(user)
         print(f"\nWelcome {current_user['name']} ({current_user['role'].title()})!")
         return True
     else:
@@ -221,8 +240,8 @@ def logout():
     else:
         print("No user is currently logged in.")
 
-def show_retailer_dashboard(connection):
-    retailer = Retailer(connection, current_user['id'])
+def show_retailer_dashboard(pool):
+    retailer = Retailer(pool, current_user['id'])
     while True:
         print("\n=== RETAILER DASHBOARD ===")
         print("1. View Available Inventory")
@@ -239,24 +258,31 @@ def show_retailer_dashboard(connection):
             quantity = input("Enter quantity: ")
             retailer.place_order(int(product_id), int(quantity))
         elif choice == '3':
-            orders = connection.execute(
-                "SELECT o.id, p.product_name, o.quantity, o.status FROM orders o "
-                "JOIN inventory p ON o.product_id = p.id "
-                "WHERE o.retailer_id = ?",
-                (current_user['id'],)
-            ).fetchall()
+            with pool.reader() as conn:
+                # Distributor name comes from the same query; unfulfilled orders have no distributor yet
+                orders = conn.execute(
+                    "SELECT o.id, p.product_name, o.quantity, o.status, u.name AS distributor_name FROM orders o "
+                    "JOIN inventory p ON o.product_id = p.id "
+                    "LEFT JOIN users u ON o.distributor_id = u.id "
+                    "WHERE o.retailer_id = ?",
+                    (current_user['id'],)
+                ).fetchall()
             
-            print("\nYour Orders:")
-            for order in orders:
-                print(f"ID: {order[0]}, Product: {order[1]}, Qty: {order[2]}, Status: {order[3]}")
+            lines = ["\nYour Orders:"]
+            lines.extend(
+                f"ID: {order['id']}, Product: {order['product_name']}, Qty: {order['quantity']}, Status: {order['status']}, "
+                f"Distributor: {order['distributor_name'] or 'Not assigned'}"
+                for order in orders
+            )
+            print("\n".join(lines))
         elif choice == '4':
             logout()
             break
         else:
             print("Invalid option!")
 
-def show_distributor_dashboard(connection):
-    distributor = Distributor(connection, current_user['id'])
+def show_distributor_dashboard(pool):
+    distributor = Distributor(pool, current_user['id'])
     while True:
         print("\n=== DISTRIBUTOR DASHBOARD ===")
         print("1. View Manufacturer Inventory")
@@ -274,23 +300,28 @@ def show_distributor_dashboard(connection):
         elif choice == '3':
             distributor.manage_inventory()
         elif choice == '4':
-            orders = connection.execute(
-                "SELECT o.id, r.name, p.product_name, o.quantity, o.status FROM orders o "
-                "JOIN users r ON o.retailer_id = r.id "
-                "JOIN inventory p ON o.product_id = p.id"
-            ).fetchall()
+            with pool.reader() as conn:
+                orders = conn.execute(
+                    "SELECT o.id, r.name AS retailer_name, p.product_name, o.quantity, o.status FROM orders o "
+                    "JOIN users r ON o.retailer_id = r.id "
+                    "JOIN inventory p ON o.product_id = p.id"
+                ).fetchall()
             
-            print("\nAll Orders:")
-            for order in orders:
-                print(f"ID: {order[0]}, Retailer: {order[1]}, Product: {order[2]}, Qty: {order[3]}, Status: {order[4]}")
+            lines = ["\nAll Orders:"]
+            lines.extend(
+                f"ID: {order['id']}, Retailer: {order['retailer_name']}, Product: {order['product_name']}, "
+                f"Qty: {order['quantity']}, Status: {order['status']}"
+                for order in orders
+            )
+            print("\n".join(lines))
         elif choice == '5':
             logout()
             break
         else:
             print("Invalid option!")
 
-def show_manufacturer_dashboard(connection):
-    manufacturer = Manufacturer(connection, current_user['id'])
+def show_manufacturer_dashboard(pool):
+    manufacturer = Manufacturer(pool, current_user['id'])
     while True:
         print("\n=== MANUFACTURER DASHBOARD ===")
         print("1. Produce Goods")
@@ -305,19 +336,64 @@ def show_manufacturer_dashboard(connection):
         elif choice == '2':
             manufacturer.view_distributor_orders()
         elif choice == '3':
-            inventory = connection.execute(
-                "SELECT id, product_name, quantity, cost FROM manufacturer_inventory"
-            ).fetchall()
+            with pool.reader() as conn:
+                inventory = conn.execute(
+                    "SELECT id, product_name, quantity, cost FROM manufacturer_inventory"
+                ).fetchall()
             
-            print("\nProduction Inventory:")
-            for item in inventory:
-                print(f"ID: {item[0]}, Product: {item[1]}, Qty: {item[2]}, Cost: {item[3]}")
+            lines = ["\nProduction Inventory:"]
+            lines.extend(
+                f"ID: {item['id']}, Product: {item['product_name']}, Qty: {item['quantity']}, Cost: {item['cost']}"
+                for item in inventory
+            )
+            print("\n".join(lines))
         elif choice == '4':
             logout()
             break
         else:
             print("Invalid option!")
 
+def bulk_insert(connection, table, cols, rows, chunk=100):
+    """INSERT OR IGNORE rows using multi-row VALUES statements, a chunk of rows at a time"""
+    # Stay under SQLite's default limit of 999 bound parameters per statement
+    chunk = max(1, min(chunk, 999 // len(cols)))
+    row_placeholder = f"({', '.join('?' * len(cols))})"
+    prefix = f"INSERT OR IGNORE INTO {table} ({', '.join(cols)}) VALUES "
+    for start in range(0, len(rows), chunk):
+        batch = rows[start:start + chunk]
+        connection.execute(
+            prefix + ", ".join([row_placeholder] * len(batch)),
+            list(itertools.chain.from_iterable(batch))
+        )
+
+def migrate_inventory_names(connection):
+    """One-off migration making inventory.product_name unique; returns False if conflicting rows block it"""
+    groups = connection.execute(
+        "SELECT product_name, COUNT(DISTINCT price), COUNT(DISTINCT available_for_retailer) FROM inventory "
+        "GROUP BY product_name HAVING COUNT(*) > 1"
+    ).fetchall()
+    conflicts = [name for name, prices, flags in groups if prices > 1 or flags > 1]
+    if conflicts:
+        print(f"Inventory migration skipped, these products are listed more than once with different "
+              f"price or availability: {', '.join(conflicts)}")
+        return False
+    if groups:
+        # Rows differing only in quantity fold into the lowest id, and their orders follow it
+        connection.execute(
+            "UPDATE inventory SET quantity = (SELECT SUM(d.quantity) FROM inventory d WHERE d.product_name = inventory.product_name) "
+            "WHERE id IN (SELECT MIN(id) FROM inventory GROUP BY product_name HAVING COUNT(*) > 1)"
+        )
+        connection.execute(
+            "UPDATE orders SET product_id = (SELECT MIN(k.id) FROM inventory k JOIN inventory i ON k.product_name = i.product_name "
+            "WHERE i.id = orders.product_id) "
+            "WHERE product_id NOT IN (SELECT MIN(id) FROM inventory GROUP BY product_name) AND product_id IN (SELECT id FROM inventory)"
+        )
+        connection.execute("DELETE FROM inventory WHERE id NOT IN (SELECT MIN(id) FROM inventory GROUP BY product_name)")
+        print(f"Merged duplicate inventory entries: {', '.join(group[0] for group in groups)}")
+    # The inventory upsert's ON CONFLICT(product_name) relies on this index
+    connection.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_inventory_name ON inventory(product_name)")
+    return True
+
 def initialize_database(connection):
     """Create tables and add sample data if they don't exist"""
     queries = [
@@ -366,55 +442,136 @@ def initialize_database(connection):
             FOREIGN KEY(manufacturer_id) REFERENCES users(id)
         )"""
     ]
+    # Indices for the dashboard filters; created after the seed rows so the bulk load skips index upkeep
+    indexes = [
+        "CREATE INDEX IF NOT EXISTS idx_inv_avail ON inventory(available_for_retailer) WHERE available_for_retailer = 1",
+        "CREATE INDEX IF NOT EXISTS idx_mi_avail ON manufacturer_inventory(available_for_distributor)",
+        "CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status)",
+        "CREATE INDEX IF NOT EXISTS idx_orders_retailer ON orders(retailer_id)",
+        "CREATE INDEX IF NOT EXISTS idx_morders_status ON manufacturer_orders(status)",
+        # Login goes through the UNIQUE(username) autoindex; drop the unused covering index older databases carry
+        "DROP INDEX IF EXISTS idx_users_login"
+    ]
     
     try:
-        with connection:
-            for query in queries:
-                connection.execute(query)
-            
-            # Add sample users if they don't exist
-            connection.execute(
-                "INSERT OR IGNORE INTO users VALUES (1, 'retailer1', 'pass123', 'ABC Store', 'retailer', 'retailer@example.com')"
-            )
-            connection.execute(
-                "INSERT OR IGNORE INTO users VALUES (2, 'distributor1', 'pass123', 'XYZ Distributors', 'distributor', 'distributor@example.com')"
-            )
-            connection.execute(
-                "INSERT OR IGNORE INTO users VALUES (3, 'manufacturer1', 'pass123', 'Global Manufacturers', 'manufacturer', 'manufacturer@example.com')"
-            )
-            
-            # Add sample inventory
-            connection.execute(
-                "INSERT OR IGNORE INTO manufacturer_inventory VALUES (1, 'Widget A', 100, 5.99, 1)"
-            )
-            connection.execute(
-                "INSERT OR IGNORE INTO inventory VALUES (1, 'Widget A Retail', 50, 9.99, 1)"
-            )
-            
+        # Run all DDL and seed rows in one write transaction so they share a single commit
+        connection.execute("BEGIN IMMEDIATE")
+        for query in queries:
+            connection.execute(query)
+        
+        # Add sample users if they don't exist
+        users_seed = [
+            (1, 'retailer1', 'pass123', 'ABC Store', 'retailer', 'retailer@example.com'),
+            (2, 'distributor1', 'pass123', 'XYZ Distributors', 'distributor', 'distributor@example.com'),
+            (3, 'manufacturer1', 'pass123', 'Global Manufacturers', 'manufacturer', 'manufacturer@example.com'),
+        ]
+        bulk_insert(connection, "users", ("id", "username", "password", "name", "role", "email"), users_seed)
+        
+        # Add sample inventory
+        manufacturer_inventory_seed = [(1, 'Widget A', 100, 5.99, 1)]
+        inventory_seed = [(1, 'Widget A Retail', 50, 9.99, 1)]
+        bulk_insert(connection, "manufacturer_inventory",
+                    ("id", "product_name", "quantity", "cost", "available_for_distributor"), manufacturer_inventory_seed)
+        bulk_insert(connection, "inventory",
+                    ("id", "product_name", "quantity", "price", "available_for_retailer"), inventory_seed)
+        for index in indexes:
+            connection.execute(index)
+        # Schema migrations are numbered by PRAGMA user_version and each runs once
+        if connection.execute("PRAGMA user_version").fetchone()[0] < 1 and migrate_inventory_names(connection):
+            connection.execute("PRAGMA user_version = 1")
+        connection.commit()
+        # Give the planner real row counts for the dashboard joins
+        connection.execute("ANALYZE")
         print("Database initialized successfully")
     except Exception as e:
+        connection.rollback()
         print(f"Error initializing database: {e}")
 def get_connection(db_name):
     try: 
-        return sqlite3.connect(db_name)
+        # Autocommit mode: write paths open their own BEGIN IMMEDIATE through write_tx
+        conn = sqlite3.connect(db_name, check_same_thread=False, cached_statements=256, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        # WAL lets dashboards read while a writer commits; NORMAL sync is safe under WAL
+        conn.executescript(
+            "PRAGMA journal_mode=WAL;"
+            "PRAGMA synchronous=NORMAL;"
+            "PRAGMA busy_timeout=5000;"
+            "PRAGMA cache_size=-65536;"
+            "PRAGMA temp_store=MEMORY;"
+            "PRAGMA foreign_keys=ON;"
+        )
+        return conn
     except Exception as e: 
         print(f"exception1 {e}")
         raise
 
+@contextmanager
+def write_tx(conn):
+    """Run a block in a BEGIN IMMEDIATE transaction, committing on success and rolling back on error"""
+    # Taking the write lock up front makes a competing writer wait on busy_timeout instead of failing mid-transaction
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+class ConnPool:
+    """One read-write connection plus a set of read-only connections to the same WAL database"""
+    def __init__(self, path, readers=4):
+        self._writer = get_connection(path)
+        self._write_lock = threading.Lock()
+        self._readers = queue.Queue()
+        for _ in range(readers):
+            conn = sqlite3.connect(
+                f"file:{path}?mode=ro", uri=True, check_same_thread=False, cached_statements=256, isolation_level=None
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._readers.put(conn)
+
+    @contextmanager
+    def writer(self):
+        """Run a write transaction on the single writer connection"""
+        with self._write_lock, write_tx(self._writer):
+            yield self._writer
+
+    @property
+    def write_connection(self):
+        """The writer connection itself, for callers that manage their own transaction"""
+        return self._writer
+
+    @contextmanager
+    def reader(self):
+        """Borrow a read-only connection and return it to the pool afterwards"""
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    def close(self):
+        # Refresh planner statistics that have drifted since they were last gathered
+        self._writer.execute("PRAGMA optimize")
+        while not self._readers.empty():
+            self._readers.get_nowait().close()
+        self._writer.close()
+
 def main():
     
     
-    conn = get_connection("supply_chain.db")
-    initialize_database(conn)
+    pool = ConnPool("supply_chain.db")
+    initialize_database(pool.write_connection)
     
     while True:
         if current_user:
             if current_user['role'] == 'retailer':
-                show_retailer_dashboard(conn)
+                show_retailer_dashboard(pool)
             elif current_user['role'] == 'distributor':
-                show_distributor_dashboard(conn)
+                show_distributor_dashboard(pool)
             elif current_user['role'] == 'manufacturer':
-                show_manufacturer_dashboard(conn)
+                show_manufacturer_dashboard(pool)
         else:
             print("\n=== Supply Chain Management System ===")
             print("1. Login")
@@ -423,7 +580,7 @@ def main():
             choice = input("Select option: ")
             
             if choice == '1':
-                if login(conn):
+                if login(pool):
                     continue
             elif choice == '2':
                 print("Exiting system...")
@@ -431,14 +588,8 @@ def main():
             else:
                 print("Invalid option!")
     
-    conn.close()
+    pool.close()
 
 if __name__ == "__main__":
     main()
-    
-def get_connection(db_name):
-    try: 
-        return sqlite3.connect(db_name)
-    except Exception as e: 
-        print(f"exception1 {e}")
-        raise
+
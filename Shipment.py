@@ -1,4 +1,7 @@
 class Shipment:
+    __slots__ = ("shipment_id", "supplier", "destination_warehouse", "products", "shipment_date",
+                 "expected_arrival", "status")
+
     def __init__(self, shipment_id, supplier, destination_warehouse, products, shipment_date, expected_arrival, status):
         self.shipment_id = shipment_id
         self.supplier = supplier
@@ -9,9 +12,7 @@ class Shipment:
         self.status = status
 
     def get_shipment_details(self):
-        product_details = ""
-        for p_id, qty in self.products.items():
-            product_details += f"- {p_id}: {qty} units\n"
+        product_details = "".join(f"- {p_id}: {qty} units\n" for p_id, qty in self.products.items())
         return (
             f"Shipment ID: {self.shipment_id}\n"
             f"Supplier: {self.supplier.name}\n"
@@ -25,8 +26,7 @@ class Shipment:
     def deliver(self):
         if self.status != "Delivered":
             if self.destination_warehouse:
-                for product_id, quantity in self.products.items():
-                    self.destination_warehouse.store_product(product_id, quantity)
+                self.destination_warehouse.store_products(self.products)
                 self.status = "Delivered"
                 print(f"Shipment {self.shipment_id} delivered.")
             else:
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 
 class Supplier(ABC):
+    __slots__ = ("supplier_id", "name", "contact_info", "products_supplied", "rating")
+
     def __init__(self, supplier_id, name, contact_info, products_supplied, rating):
         self.supplier_id = supplier_id
         self.name = name
@@ -23,6 +25,8 @@ class Supplier(ABC):
 
 # Local parts supplier class
 class LocalPartsSupplier(Supplier):
+    __slots__ = ("part_type",)
+
     def __init__(self, supplier_id, name, contact, location, part_type):
         super().__init__(supplier_id, name, contact, location)
         self.part_type = part_type
@@ -32,6 +36,8 @@ class LocalPartsSupplier(Supplier):
 
 # International parts supplier class
 class InternationalPartsSupplier(Supplier):
+    __slots__ = ("country", "part_type")
+
     def __init__(self, supplier_id, name, contact, location, country, part_type):
         super().__init__(supplier_id, name, contact, location)
         self.country = country
@@ -42,6 +48,8 @@ class InternationalPartsSupplier(Supplier):
 
 # Battery supplier class
 class BatterySupplier(Supplier):
+    __slots__ = ("battery_type",)
+
     def __init__(self, supplier_id, name, contact, location, battery_type):
         super().__init__(supplier_id, name, contact, location)
         self.battery_type = battery_type
@@ -52,12 +60,17 @@ class BatterySupplier(Supplier):
 # Supplier management class
 class SupplierManager:
     def __init__(self):
-        self.suppliers = []
+        # Suppliers indexed by id; dicts keep insertion order so listing order is unchanged
+        self._by_id = {}
         self.next_id = 1
 
+    @property
+    def suppliers(self):
+        return list(self._by_id.values())
+
     def add_supplier(self, name, contact, location):
         supplier = Supplier(self.next_id, name, contact, location)
-        self.suppliers.append(supplier)
+        self._by_id[supplier.supplier_id] = supplier
         self.next_id += 1
 
     def update_supplier(self, supplier_id, name=None, contact=None, location=None):
@@ -66,12 +79,7 @@ class SupplierManager:
             supplier.update_info(name, contact, location)
 
     def delete_supplier(self, supplier_id):
-        supplier = self.find_supplier(supplier_id)
-        if supplier:
-            self.suppliers.remove(supplier)
+        self._by_id.pop(supplier_id, None)
 
     def find_supplier(self, supplier_id):
-        for supplier in self.suppliers:
-            if supplier.supplier_id == supplier_id:
-                return supplier
-        return None
+        return self._by_id.get(supplier_id)
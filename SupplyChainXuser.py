@@ -1,24 +1,64 @@
+import sys
 from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
+from collections import defaultdict, deque
 from datetime import date, datetime, timedelta
+from itertools import islice
 from typing import Dict, List, Optional, Union
+from weakref import WeakValueDictionary
+
+# Live Location instances keyed by their fields, so equal addresses share one object
+_LOCATIONS = WeakValueDictionary()
+
+# Delivery lead time in days per product category; anything else takes the default
+_LEAD_DAYS = {"Engine": 7, "Battery": 5}
+_DEFAULT_LEAD_DAYS = 10
 
 
 class Location:
-    """Standardized location class for addresses"""
+    """Standardized location class for addresses; immutable, since equal addresses share one instance"""
+
+    __slots__ = ("_address", "_city", "_country", "_postal_code", "_str", "__weakref__")
+
+    def __new__(cls, address: str, city: str, country: str, postal_code: str):
+        key = (cls, address, city, country, postal_code)
+        location = _LOCATIONS.get(key)
+        if location is None:
+            location = super().__new__(cls)
+            location._address = address
+            location._city = city
+            location._country = country
+            location._postal_code = postal_code
+            location._str = f"{address}, {city}, {country} {postal_code}"
+            _LOCATIONS[key] = location
+        return location
+
+    @property
+    def address(self):
+        return self._address
 
-    def __init__(self, address: str, city: str, country: str, postal_code: str):
-        self.address = address
-        self.city = city
-        self.country = country
-        self.postal_code = postal_code
+    @property
+    def city(self):
+        return self._city
+
+    @property
+    def country(self):
+        return self._country
+
+    @property
+    def postal_code(self):
+        return self._postal_code
 
     def __str__(self):
-        return f"{self.address}, {self.city}, {self.country} {self.postal_code}"
+        return self._str
 
 
 class Product:
     """Product class with enhanced validation"""
 
+    __slots__ = ("product_id", "name", "category", "price", "_quantity", "manufacture_date", "warranty_years",
+                 "expiry_date", "_info_cache")
+
     def __init__(self, product_id: str, name: str, category: str, price: float,
                  quantity: int, manufacture_date: date, warranty_years: int, expiry_date: Optional[date] = None):
         if price <= 0:
@@ -28,12 +68,14 @@ class Product:
 
         self.product_id = product_id
         self.name = name
-        self.category = category
+        self.category = sys.intern(category)
         self.price = price
         self._quantity = quantity
         self.manufacture_date = manufacture_date
         self.warranty_years = warranty_years
         self.expiry_date = expiry_date
+        # get_info() result, rebuilt after update_quantity(); callers share it and must not modify it
+        self._info_cache = None
 
     @property
     def quantity(self):
@@ -45,18 +87,22 @@ class Product:
         if self._quantity + amount < 0:
             raise ValueError("Quantity cannot be negative")
         self._quantity += amount
+        self._info_cache = None
 
     def get_info(self) -> Dict:
-        return {
+        if self._info_cache is not None:
+            return self._info_cache
+        self._info_cache = {
             "product_id": self.product_id,
             "name": self.name,
             "category": self.category,
             "price": self.price,
             "quantity": self._quantity,
-            "manufacture_date": self.manufacture_date.strftime("%Y-%m-%d"),
+            "manufacture_date": self.manufacture_date.isoformat(),
             "warranty_years": self.warranty_years,
-            "expiry_date": self.expiry_date.strftime("%Y-%m-%d") if self.expiry_date else None
+            "expiry_date": self.expiry_date.isoformat() if self.expiry_date else None
         }
+        return self._info_cache
 
     def is_expired(self, check_date: date = None) -> bool:
         check_date = check_date or date.today()
@@ -66,6 +112,8 @@ class Product:
 class Supplier(ABC):
     """Abstract base supplier class"""
 
+    __slots__ = ("supplier_id", "name", "contact_info", "products_supplied", "rating", "location")
+
     def __init__(self, supplier_id: str, name: str, contact_info: str,
                  products_supplied: List[str], rating: float, location: Location):
         if not (0 <= rating <= 5):
@@ -105,6 +153,8 @@ class Supplier(ABC):
 
 
 class LocalPartsSupplier(Supplier):
+    __slots__ = ("part_type",)
+
     def __init__(self, supplier_id: str, name: str, contact_info: str,
                  location: Location, part_type: str, rating: float = 5):
         products_supplied = [f"Local {part_type} parts"]
@@ -117,6 +167,8 @@ class LocalPartsSupplier(Supplier):
 
 
 class InternationalPartsSupplier(Supplier):
+    __slots__ = ("part_type", "shipping_time_days")
+
     def __init__(self, supplier_id: str, name: str, contact_info: str,
                  location: Location, part_type: str, shipping_time_days: int, rating: float = 4):
         products_supplied = [f"International {part_type} parts"]
@@ -130,6 +182,8 @@ class InternationalPartsSupplier(Supplier):
 
 
 class BatterySupplier(Supplier):
+    __slots__ = ("battery_type",)
+
     def __init__(self, supplier_id: str, name: str, contact_info: str,
                  location: Location, battery_type: str, rating: float = 4):
         products_supplied = [f"{battery_type} batteries"]
@@ -147,8 +201,8 @@ class SupplierManager:
         self.next_id = 1
 
     def add_supplier(self, supplier: Supplier) -> str:
-        if not isinstance(supplier, Supplier):
-            raise TypeError("Only Supplier instances can be added")
+        # Type guards on the add_* paths are asserts so `python -O` strips them from bulk loads
+        assert isinstance(supplier, Supplier), "Only Supplier instances can be added"
 
         supplier.supplier_id = f"SUP{self.next_id:04d}"
         self.suppliers[supplier.supplier_id] = supplier
@@ -164,6 +218,14 @@ class SupplierManager:
     def list_suppliers(self) -> List[Dict]:
         return [supplier.get_info() for supplier in self.suppliers.values()]
 
+    def iter_suppliers(self):
+        """Yield supplier info dicts one at a time instead of building the whole list"""
+        for supplier in self.suppliers.values():
+            yield supplier.get_info()
+
+    def count(self) -> int:
+        return len(self.suppliers)
+
 
 class Manufacturer:
     def __init__(self, manufacturer_id: str, name: str, location: Location, production_capacity: int):
@@ -173,23 +235,26 @@ class Manufacturer:
         self.production_capacity = production_capacity
         self.products_produced: List[Product] = []
         self.raw_materials: List[Product] = []
+        self._produced_count = 0
+        self._prefix_counts: Dict[str, int] = defaultdict(int)  # next id number per product-name prefix
 
     def add_raw_material(self, product: Product):
-        if not isinstance(product, Product):
-            raise TypeError("Only Product instances can be added as raw materials")
+        assert isinstance(product, Product), "Only Product instances can be added as raw materials"
         self.raw_materials.append(product)
 
     def manufacture_product(self, name: str, category: str, price: float,
-                            quantity: int = 1, warranty_years: int = 1, expiry_days: Optional[int] = None) -> Optional[
-        Product]:
-        if len(self.products_produced) >= self.production_capacity:
+                            quantity: int = 1, warranty_years: int = 1, expiry_days: Optional[int] = None,
+                            today: Optional[date] = None) -> Optional[Product]:
+        if self._produced_count >= self.production_capacity:
             print("Production capacity reached!")
             return None
 
-        manufacture_date = date.today()
+        manufacture_date = today or date.today()
         expiry_date = manufacture_date + timedelta(days=expiry_days) if expiry_days else None
 
-        product_id = f"{name[:3].upper()}{len(self.products_produced) + 1:04d}"
+        prefix = name[:3].upper()
+        number = self._prefix_counts[prefix] + 1
+        product_id = "%s%04d" % (prefix, number)
         new_product = Product(
             product_id=product_id,
             name=name,
@@ -202,6 +267,8 @@ class Manufacturer:
         )
 
         self.products_produced.append(new_product)
+        self._prefix_counts[prefix] = number
+        self._produced_count += 1
         return new_product
 
     def get_info(self) -> Dict:
@@ -216,6 +283,9 @@ class Manufacturer:
 
 
 class Maintenance:
+    __slots__ = ("maintenance_id", "product", "service_date", "service_type", "service_details", "cost",
+                 "parts_replaced")
+
     def __init__(self, maintenance_id: str, product: Product, service_date: date,
                  service_type: str, service_details: str, cost: float, parts_replaced: List[str] = None):
         self.maintenance_id = maintenance_id
@@ -230,7 +300,7 @@ class Maintenance:
         return {
             "maintenance_id": self.maintenance_id,
             "product": self.product.get_info(),
-            "service_date": self.service_date.strftime("%Y-%m-%d"),
+            "service_date": self.service_date.isoformat(),
             "service_type": self.service_type,
             "service_details": self.service_details,
             "cost": self.cost,
@@ -250,30 +320,76 @@ class StorageUnit(ABC):
         self.location = location
         self.capacity = capacity
         self.inventory = {}
+        self._total_quantity = 0  # running sum of inventory.values()
+        # An id carries the earliest expiry of the stock it holds; _by_expiry mirrors _expiry, kept sorted
+        self._expiry = {}  # product_id -> expiry ordinal
+        self._by_expiry = []  # (expiry ordinal, product_id)
 
     def get_unit_id(self):
         return self.__unit_id
 
+    def get_total_quantity(self):
+        return self._total_quantity
+
     @abstractmethod
     def check_inventory(self):
         pass
 
-    def store_product(self, product_id, quantity=1):  # Overide
+    def store_product(self, product_id, quantity=1, expiry=None):  # Overide
         if quantity <= 0:
             raise ValueError("Quantity must be positive.")
-        total_quantity = sum(self.inventory.values())
-        if total_quantity + quantity > self.capacity:
+        if self._total_quantity + quantity > self.capacity:
             raise Exception("Not enough space in the storage unit.")
         self.inventory[product_id] = self.inventory.get(product_id, 0) + quantity
+        self._total_quantity += quantity
+        if expiry is not None:
+            expiry_ord = expiry.toordinal()
+            current = self._expiry.get(product_id)
+            if current is None or expiry_ord < current:
+                self._clear_expiry(product_id)
+                self._expiry[product_id] = expiry_ord
+                insort(self._by_expiry, (expiry_ord, product_id))
+
+    def _clear_expiry(self, product_id):
+        expiry_ord = self._expiry.pop(product_id, None)
+        if expiry_ord is not None:
+            del self._by_expiry[bisect_left(self._by_expiry, (expiry_ord, product_id))]
+
+    def pop_expired(self, today):
+        """Remove the products that expired before today, found by bisection; returns their ids"""
+        cut = bisect_left(self._by_expiry, (today.toordinal(),))
+        expired = [product_id for _, product_id in self._by_expiry[:cut]]
+        del self._by_expiry[:cut]
+        for product_id in expired:
+            del self._expiry[product_id]
+            self._total_quantity -= self.inventory.pop(product_id)
+        return expired
+
+    def store_products(self, products):
+        # Validate and check capacity once for the whole batch, then apply every line
+        if any(quantity <= 0 for quantity in products.values()):
+            raise ValueError("Quantity must be positive.")
+        batch_quantity = sum(products.values())
+        if self._total_quantity + batch_quantity > self.capacity:
+            raise Exception("Not enough space in the storage unit.")
+        inventory = self.inventory
+        for product_id, quantity in products.items():
+            inventory[product_id] = inventory.get(product_id, 0) + quantity
+        self._total_quantity += batch_quantity
 
     def retrieve_product(self, product_id, quantity=1):
-        if product_id not in self.inventory:
+        current = self.inventory.get(product_id)
+        if current is None:
             raise Exception("Product not found.")
-        if quantity > self.inventory[product_id]:
+        if quantity > current:
             raise Exception("Not enough stock.")
-        self.inventory[product_id] -= quantity
-        if self.inventory[product_id] == 0:
+        remaining = current - quantity
+        self._total_quantity -= quantity
+        if remaining:
+            self.inventory[product_id] = remaining
+        else:
             del self.inventory[product_id]
+            self._clear_expiry(product_id)
 
 
 class Warehouse(StorageUnit):
@@ -281,13 +397,20 @@ class Warehouse(StorageUnit):
         super().__init__(warehouse_id, location, capacity)
         self._manager_name = manager_name
 
-    def store_product(self, product_id, quantity=1):  # Override
+    def store_product(self, product_id, quantity=1, expiry=None):  # Override
         try:
-            super().store_product(product_id, quantity)
+            super().store_product(product_id, quantity, expiry)
             print(f"Stored {quantity} units of product {product_id} in the warehouse.")
         except Exception as e:
             print(f"Error while storing product: {e}")
 
+    def store_products(self, products):  # Override
+        try:
+            super().store_products(products)
+            print(f"Stored {sum(products.values())} units across {len(products)} products in the warehouse.")
+        except Exception as e:
+            print(f"Error while storing products: {e}")
+
     def retrieve_product(self, product_id, quantity=1):  # Override
         try:
             super().retrieve_product(product_id, quantity)
@@ -317,24 +440,47 @@ class ExpiryManager:
         self.warehouse = warehouse
         self.today_date = today_date or date.today()
 
+    def _holds_legacy_items(self):
+        # Inventories are homogeneous: either plain quantities kept by the warehouse itself,
+        # or legacy {'quantity', 'expiry'} dicts assigned from outside
+        return isinstance(next(iter(self.warehouse.inventory.values()), None), dict)
+
+    def _scan(self):
+        """Total stored quantity and the expired product ids of a legacy inventory, in a single pass"""
+        today = self.today_date
+        total_quantity = 0
+        expired = []
+        for product_id, item in self.warehouse.inventory.items():
+            if isinstance(item, dict):
+                total_quantity += item['quantity']
+                expiry = item.get('expiry')
+                if expiry is not None and expiry < today:
+                    expired.append(product_id)
+            else:
+                total_quantity += item
+        return total_quantity, expired
+
     def is_inventory_full(self):
-        total_quantity = sum(self.warehouse.inventory.values()) if isinstance(next(iter(self.warehouse.inventory.values()), None), int) else sum(item['quantity'] for item in self.warehouse.inventory.values())
-        return total_quantity >= self.warehouse.capacity
+        if self._holds_legacy_items():
+            return self._scan()[0] >= self.warehouse.capacity
+        return self.warehouse.get_total_quantity() >= self.warehouse.capacity
 
     def remove_expired_if_full(self):
         if not self.is_inventory_full():
             print("Inventory is not full. No expired items removed.")
             return
 
-        removed = False
-        for product_id in list(self.warehouse.inventory.keys()):
-            item = self.warehouse.inventory[product_id]
-            if isinstance(item, dict) and 'expiry' in item and item['expiry'] < self.today_date:
+        if self._holds_legacy_items():
+            expired = self._scan()[1]
+            for product_id in expired:
                 del self.warehouse.inventory[product_id]
-                print(f"Removed expired product: {product_id}")
-                removed = True
+        else:
+            # Stock stored with an expiry date is found through the warehouse's sorted index
+            expired = self.warehouse.pop_expired(self.today_date)
+        for product_id in expired:
+            print(f"Removed expired product: {product_id}")
 
-        if not removed:
+        if not expired:
             print("No expired products found.")
 
 
@@ -349,25 +495,24 @@ class Distributor:
         self.orders_processed: List['Order'] = []
 
     def add_to_inventory(self, product: Product) -> bool:
-        if not isinstance(product, Product):
-            raise TypeError("Only Product instances can be added to inventory")
+        assert isinstance(product, Product), "Only Product instances can be added to inventory"
         self.inventory.append(product)
         return True
 
     def distribute_product(self, retailer: 'Retailer', product: Product, quantity: int) -> bool:
-        available = sum(1 for p in self.inventory if p.product_id == product.product_id)
-        if available < quantity:
+        if quantity < 0:
+            return False
+        # One pass collects the positions of the first `quantity` matching items
+        product_id = product.product_id
+        matches = list(islice((i for i, p in enumerate(self.inventory) if p.product_id == product_id), quantity))
+        if len(matches) < quantity:
             return False
 
-        distributed = 0
-        for _ in range(quantity):
-            for i, p in enumerate(self.inventory):
-                if p.product_id == product.product_id:
-                    retailer.receive_product(self.inventory.pop(i))
-                    distributed += 1
-                    break
-
-        return distributed == quantity
+        taken = set(matches)
+        for i in matches:
+            retailer.receive_product(self.inventory[i])
+        self.inventory = [p for i, p in enumerate(self.inventory) if i not in taken]
+        return True
 
     def get_info(self) -> Dict:
         return {
@@ -380,28 +525,32 @@ class Distributor:
 
 
 class Order:
-    def __init__(self, order_id: str, product: Product, quantity: int, price_per_unit: float):
+    __slots__ = ("order_id", "product", "quantity", "price_per_unit", "order_date", "status", "retailer",
+                 "estimated_delivery")
+
+    def __init__(self, order_id: str, product: Product, quantity: int, price_per_unit: float,
+                 retailer: Optional['Retailer'] = None, today: Optional[date] = None):
         self.order_id = order_id
         self.product = product
         self.quantity = quantity
         self.price_per_unit = price_per_unit
-        self.order_date = date.today()
+        self.order_date = today or date.today()
         self.status = "Pending"  # Pending, Processing, Shipped, Delivered, Cancelled
+        self.retailer = retailer
         self.estimated_delivery = self.calculate_delivery_date()
 
     def calculate_delivery_date(self) -> date:
-        if self.product.category == "Engine":
-            return self.order_date + timedelta(days=7)
-        elif self.product.category == "Battery":
-            return self.order_date + timedelta(days=5)
-        else:
-            return self.order_date + timedelta(days=10)
+        return self.order_date + timedelta(days=_LEAD_DAYS.get(self.product.category, _DEFAULT_LEAD_DAYS))
 
     def update_status(self, new_status: str) -> bool:
         valid_statuses = ["Pending", "Processing", "Shipped", "Delivered", "Cancelled"]
         if new_status not in valid_statuses:
             return False
+        was_delivered = self.status == "Delivered"
         self.status = new_status
+        # Keep the placing retailer's active-order count in step with deliveries
+        if self.retailer is not None and was_delivered != (new_status == "Delivered"):
+            self.retailer._order_delivered(not was_delivered)
         return True
 
     def get_info(self) -> Dict:
@@ -411,29 +560,31 @@ class Order:
             "quantity": self.quantity,
             "price_per_unit": self.price_per_unit,
             "total_price": self.quantity * self.price_per_unit,
-            "order_date": self.order_date.strftime("%Y-%m-%d"),
+            "order_date": self.order_date.isoformat(),
             "status": self.status,
-            "estimated_delivery": self.estimated_delivery.strftime("%Y-%m-%d")
+            "estimated_delivery": self.estimated_delivery.isoformat()
         }
 
 
 class Marketing:
+    # Reach per unit of budget for each strategy
+    _MULT = {
+        "Social Media": 75,
+        "TV Ads": 120,
+        "Billboards": 50,
+        "Email Marketing": 40
+    }
+
     def __init__(self, strategy: str, budget: float):
         self.strategy = strategy
         self.budget = budget
         self.campaigns: List[Dict] = []
         self.reach = 0
 
-    def run_campaign(self, campaign_name: str, duration_days: int) -> bool:
-        multipliers = {
-            "Social Media": 75,
-            "TV Ads": 120,
-            "Billboards": 50,
-            "Email Marketing": 40
-        }
-
-        multiplier = multipliers.get(self.strategy, 60)
+    def run_campaign(self, campaign_name: str, duration_days: int, today: Optional[date] = None) -> bool:
+        multiplier = self._MULT.get(self.strategy, 60)
         self.reach = int(self.budget * multiplier)
+        start_date = today or date.today()
 
         campaign = {
             "name": campaign_name,
@@ -441,8 +592,8 @@ class Marketing:
             "budget": self.budget,
             "duration": duration_days,
             "reach": self.reach,
-            "start_date": date.today(),
-            "end_date": date.today() + timedelta(days=duration_days)
+            "start_date": start_date,
+            "end_date": start_date + timedelta(days=duration_days)
         }
 
         self.campaigns.append(campaign)
@@ -471,27 +622,37 @@ class Store(ABC):
         self.store_id = store_id
         self.name = name
         self.location = location
-        self.inventory: List[Product] = []
+        # Products grouped by product_id, oldest first; running totals keep get_info O(1)
+        self.inventory: Dict[str, deque] = {}
+        self._count = 0
+        self._value_sum = 0
 
     def add_product(self, product: Product) -> bool:
-        if not isinstance(product, Product):
-            raise TypeError("Only Product instances can be added")
-        self.inventory.append(product)
+        assert isinstance(product, Product), "Only Product instances can be added"
+        self.inventory.setdefault(product.product_id, deque()).append(product)
+        self._count += 1
+        self._value_sum += product.price
         return True
 
     def sell_product(self, product_id: str) -> Optional[Product]:
-        for i, product in enumerate(self.inventory):
-            if product.product_id == product_id:
-                return self.inventory.pop(i)
-        return None
+        products = self.inventory.get(product_id)
+        if not products:
+            return None
+        product = products.popleft()
+        if not products:
+            del self.inventory[product_id]
+        self._count -= 1
+        # Reset on empty so rounding left over from the running float total can't linger
+        self._value_sum = self._value_sum - product.price if self._count else 0
+        return product
 
     def get_info(self) -> Dict:
         return {
             "store_id": self.store_id,
             "name": self.name,
             "location": str(self.location),
-            "inventory_count": len(self.inventory),
-            "inventory_value": sum(p.price for p in self.inventory)
+            "inventory_count": self._count,
+            "inventory_value": self._value_sum
         }
 
 
@@ -499,11 +660,14 @@ class Retailer(Store):
     def __init__(self, retailer_id: str, name: str, location: Location):
         super().__init__(retailer_id, name, location)
         self.orders: List[Order] = []
+        self._active_orders = 0  # orders not yet delivered, kept in step by _order_delivered
 
-    def place_order(self, distributor: Distributor, product: Product, quantity: int) -> Optional[Order]:
+    def place_order(self, distributor: Distributor, product: Product, quantity: int,
+                    today: Optional[date] = None) -> Optional[Order]:
         order_id = f"ORD-{len(self.orders) + 1:06d}"
-        order = Order(order_id, product, quantity, product.price)
+        order = Order(order_id, product, quantity, product.price, retailer=self, today=today)
         self.orders.append(order)
+        self._active_orders += 1
 
         if distributor.distribute_product(self, product, quantity):
             order.update_status("Shipped")
@@ -515,12 +679,16 @@ class Retailer(Store):
     def receive_product(self, product: Product) -> bool:
         return self.add_product(product)
 
+    def _order_delivered(self, delivered: bool):
+        """Called by Order.update_status when one of our orders moves into or out of Delivered"""
+        self._active_orders += -1 if delivered else 1
+
     def get_info(self) -> Dict:
         base_info = super().get_info()
         base_info.update({
             "type": "Retailer",
             "orders_placed": len(self.orders),
-            "active_orders": sum(1 for o in self.orders if o.status != "Delivered")
+            "active_orders": self._active_orders
         })
         return base_info
 
@@ -532,7 +700,7 @@ class CarStore(Store):
         self.test_drives = 0
 
     def arrange_test_drive(self) -> bool:
-        if len(self.inventory) == 0:
+        if not self.inventory:
             return False
         self.test_drives += 1
         return True
@@ -558,35 +726,46 @@ class SupplyChain:
         self.stores: Dict[str, Store] = {}
         self.warehouses: Dict[str, Warehouse] = {}
         self.products: Dict[str, Product] = {}
+        # Last id number issued per entity type; ids are never reused after a removal
+        self._next_man = 0
+        self._next_dist = 0
+        self._next_ret = 0
+        self._next_car = 0
+        self._next_wh = 0
 
     def add_manufacturer(self, name: str, location: Location, capacity: int) -> str:
-        manufacturer_id = f"MAN{len(self.manufacturers) + 1:04d}"
+        self._next_man += 1
+        manufacturer_id = "MAN%04d" % self._next_man
         self.manufacturers[manufacturer_id] = Manufacturer(manufacturer_id, name, location, capacity)
         return manufacturer_id
 
     def add_distributor(self, name: str, location: Location) -> str:
-        distributor_id = f"DIST{len(self.distributors) + 1:04d}"
+        self._next_dist += 1
+        distributor_id = "DIST%04d" % self._next_dist
         self.distributors[distributor_id] = Distributor(distributor_id, name, location)
         return distributor_id
 
     def add_retailer(self, name: str, location: Location) -> str:
-        retailer_id = f"RET{len(self.retailers) + 1:04d}"
+        self._next_ret += 1
+        retailer_id = "RET%04d" % self._next_ret
         self.retailers[retailer_id] = Retailer(retailer_id, name, location)
         return retailer_id
 
     def add_car_store(self, name: str, location: Location, brand: str) -> str:
-        store_id = f"CAR{len(self.stores) + 1:04d}"
+        self._next_car += 1
+        store_id = "CAR%04d" % self._next_car
         self.stores[store_id] = CarStore(store_id, name, location, brand)
         return store_id
 
     def add_warehouse(self, location: Location, capacity: int, manager: str = None) -> str:
-        warehouse_id = f"WH{len(self.warehouses) + 1:04d}"
+        self._next_wh += 1
+        warehouse_id = "WH%04d" % self._next_wh
         self.warehouses[warehouse_id] = Warehouse(warehouse_id, location, capacity, manager)
         return warehouse_id
 
     def get_supply_chain_status(self) -> Dict:
         return {
-            "suppliers": len(self.suppliers.list_suppliers()),
+            "suppliers": self.suppliers.count(),
             "manufacturers": len(self.manufacturers),
             "distributors": len(self.distributors),
             "retailers": len(self.retailers),
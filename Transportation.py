@@ -4,19 +4,17 @@ class Transportation:
         self.source = source
         self.destination = destination
         self.vehicle_type = vehicle_type
-        self.cars = {}  
+        self.cars = {}  # (brand, model) -> [quantity, car_type]
         self.status = "Pending"
 
     def add_car(self, model, brand, quantity, car_type):
         """Add a car to the transport dictionary"""
-        car_id = f"{brand} {model}"  # Combine brand and model as unique car ID
-        if car_id in self.cars:
-            self.cars[car_id]['quantity'] += quantity  # Add to existing quantity if car is already in the list
+        key = (brand, model)  # Brand and model together identify a car
+        entry = self.cars.get(key)
+        if entry:
+            entry[0] += quantity  # Add to existing quantity if car is already in the list
         else:
-            self.cars[car_id] = {
-                'quantity': quantity,
-                'type': car_type
-            }
+            self.cars[key] = [quantity, car_type]
         print(f"Added {quantity} {brand} {model} cars of type '{car_type}' to the transport list.")
 
     def list_cars(self):
@@ -25,8 +23,8 @@ class Transportation:
             print("No cars in the transport list.")
         else:
             print(f"Cars being transported from {self.source} to {self.destination}:")
-            for car_id, details in self.cars.items():
-                print(f"- {details['quantity']} cars of {car_id} ({details['type']})")
+            for (brand, model), (quantity, car_type) in self.cars.items():
+                print(f"- {quantity} cars of {brand} {model} ({car_type})")
 
     def start_transport(self):
         if not self.cars:
@@ -1,12 +1,38 @@
+import os
 import sqlite3 
-from icecream import ic as print 
+
+# icecream's caller introspection is only worth paying for while debugging
+if os.environ.get("SCX_DEBUG") :
+    from icecream import ic as print 
+
+# one open connection per database file, reused across calls
+_connections = {}
 
 def get_connection (db_name) :
+    conn = _connections.get(db_name)
+    if conn is not None :
+        return conn
     try : 
-        return sqlite3.connect(db_name)
+        # autocommit mode; bulk writes open their own transaction
+        conn = sqlite3.connect(db_name, isolation_level=None, check_same_thread=False)
+        conn.executescript(
+            "PRAGMA journal_mode=WAL;"
+            "PRAGMA synchronous=NORMAL;"
+            "PRAGMA temp_store=MEMORY;"
+            "PRAGMA cache_size=-64000;"
+        )
     except Exception as e : 
         print (f"exception1 {e}")
         raise
+    _connections[db_name] = conn
+    return conn
+
+def close_connection (db_name) :
+    conn = _connections.pop(db_name, None)
+    if conn is not None :
+        # refresh planner statistics that bulk loads have left stale; cheap when nothing changed
+        conn.execute("PRAGMA optimize")
+        conn.close()
     
 def create_table(connection):
     query = """
@@ -21,11 +47,13 @@ def create_table(connection):
     try :
         with connection :
             connection.execute(query)
+            # role-filtered searches; email lookups already use the UNIQUE index
+            connection.execute("CREATE INDEX IF NOT EXISTS idx_users_role ON users(role)")
         print ("table created")
     except Exception as e:
         print (f"exception2 {e}")
         
-def insert_users (connection , id: int, name :str , role:str , email: str)  :
+def insert_user (connection , id: int, name :str , role:str , email: str)  :
     query =  "INSERT INTO users (id, name ,role , email) Values (? ,? ,? ,?)"
     try : 
         with connection:
@@ -34,14 +62,14 @@ def insert_users (connection , id: int, name :str , role:str , email: str)  :
     except Exception as e:
         print (f"exception3 {e}")
 
-def fetch_users (connection, condition: str = None) -> list[tuple] :
-    query = "SELECT * FROM users "
-    if condition :
-        query += f"WHERE {condition} "
+def fetch_users (connection, where: str = None, params: tuple = ()) -> list[tuple] :
+    # values go in params as ? placeholders so the statement text stays fixed and cached
+    query = "SELECT id, name, role, email FROM users"
+    if where :
+        query += f" WHERE {where}"
     
     try :
-        with connection :
-            rows =   connection.execute(query).fetchall()
+        rows =   connection.execute(query, params).fetchall()
         return rows    
         
     except Exception as e :
@@ -65,14 +93,25 @@ def update_user (connection , id , email):
     except Exception as e :
         print (f"exception 6 {e}") 
 
-def insert_users (connection, users: list[tuple[ int, str, str,str]]) :
-    query = "INSERT INTO users VALUES (id , name ,role , email )"
+def insert_users (connection, users: list[tuple[ int, str, str,str]], batch_size: int = 1000) :
+    query = "INSERT INTO users (id, name, role, email) VALUES (?, ?, ?, ?)"
+    # one transaction per batch: a single commit each, and the WAL stays bounded on big loads.
+    # a failing batch is rolled back but the batches before it stay committed, so the
+    # number of rows actually inserted is returned
+    inserted = 0
     try : 
-        with connection :
-            connection.executemany( query, users)
+        for start in range(0, len(users), batch_size) :
+            batch = users[start:start + batch_size]
+            connection.execute("BEGIN")
+            connection.executemany( query, batch)
+            connection.execute("COMMIT")
+            inserted += len(batch)
         print (f"{len(users)} users were added" )
     except Exception as e :
-        print (f"exception 7 {e}" )
+        if connection.in_transaction :
+            connection.rollback()
+        print (f"exception 7 {e} ({inserted} of {len(users)} users were added before the failure)" )
+    return inserted
         
 
 def main ():
@@ -87,7 +126,7 @@ def main ():
             role = input("Enter role: ")
             email = input("Enter email: ")
             
-            insert_users(connection, id, name, role , email)
+            insert_user(connection, id, name, role , email)
         elif start == "search" :
             for user in fetch_users(connection):
                 print(user)
@@ -111,7 +150,7 @@ def main ():
         print (f"exception f {e}")    
         
     finally :
-        connection.close()
+        close_connection("database3.db")
 
 
     
@@ -1,8 +1,31 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta
+from itertools import count
+from pathlib import Path
 from typing import Dict, List, Optional, Union
-from multipledispatch import dispatch
+import argparse
+import base64
+import hashlib
+import hmac
+import os
+import queue
 import sqlite3
+import sys
+import threading
+import time
+
+__all__ = [
+    "Location", "Product", "Supplier", "LocalPartsSupplier", "InternationalPartsSupplier",
+    "BatterySupplier", "SupplierManager", "SupplierManagerProxy", "Manufacturer", "Maintenance",
+    "StorageUnit", "Warehouse", "ExpiryManager", "Distributor", "Order", "PaymentProcessor",
+    "Marketing", "Store", "Retailer", "CarStore", "SupplyChain", "User"
+]
 
 
 class Location:
@@ -10,16 +33,20 @@ class Location:
 
     def __init__(self, address: str, city: str, country: str, postal_code: str):
         self.address = address
-        self.city = city
-        self.country = country
+        # City and country repeat across many locations, so share one string object for each
+        self.city = sys.intern(city)
+        self.country = sys.intern(country)
         self.postal_code = postal_code
+        self._str = f"{address}, {city}, {country} {postal_code}"
 
     def __str__(self):
-        return f"{self.address}, {self.city}, {self.country} {self.postal_code}"
+        return self._str
 
 
 class Product:
     """Product class with enhanced validation"""
+    __slots__ = ("product_id", "name", "category", "price", "_quantity", "manufacture_date", "warranty_years",
+                 "expiry_date", "_expiry_ord", "_info_cache")
 
     def __init__(self, product_id: str, name: str, category: str, price: float,
                 quantity: int, manufacture_date: date, warranty_years: int, expiry_date: Optional[date] = None):
@@ -36,6 +63,9 @@ class Product:
         self.manufacture_date = manufacture_date
         self.warranty_years = warranty_years
         self.expiry_date = expiry_date
+        self._expiry_ord = expiry_date.toordinal() if expiry_date else 0  # 0 means no expiry
+        # get_info() result, rebuilt after update_quantity(); callers share it and must not modify it
+        self._info_cache = None
 
     @property
     def quantity(self):
@@ -47,9 +77,12 @@ class Product:
         if self._quantity + amount < 0:
             raise ValueError("Quantity cannot be negative")
         self._quantity += amount
+        self._info_cache = None
 
     def get_info(self) -> Dict:
-        return {
+        if self._info_cache is not None:
+            return self._info_cache
+        self._info_cache = {
             "product_id": self.product_id,
             "name": self.name,
             "category": self.category,
@@ -59,14 +92,20 @@ class Product:
             "warranty_years": self.warranty_years,
             "expiry_date": self.expiry_date.strftime("%Y-%m-%d") if self.expiry_date else None
         }
+        return self._info_cache
 
     def is_expired(self, check_date: date = None) -> bool:
         check_date = check_date or date.today()
-        return self.expiry_date is not None and check_date > self.expiry_date
+        return self.is_expired_ord(check_date.toordinal())
+
+    def is_expired_ord(self, today_ord: int) -> bool:
+        """Expiry check against a precomputed date.toordinal(), for sweeps over many products"""
+        return self._expiry_ord != 0 and today_ord > self._expiry_ord
 
 
 class Supplier(ABC):
     """Abstract base supplier class"""
+    __slots__ = ("supplier_id", "name", "contact_info", "products_supplied", "rating", "location", "_info_cache")
 
     def __init__(self, supplier_id: str, name: str, contact_info: str,
                  products_supplied: List[str], rating: float, location: Location):
@@ -79,13 +118,16 @@ class Supplier(ABC):
         self.products_supplied = products_supplied
         self.rating = rating
         self.location = location
+        self._info_cache = None  # get_info() result, shared with callers; rebuilt after update_info()
 
     @abstractmethod
     def supply_product(self, product: Product, quantity: int) -> bool:
         pass
 
     def get_info(self) -> Dict:
-        return {
+        if self._info_cache is not None:
+            return self._info_cache
+        self._info_cache = {
             "supplier_id": self.supplier_id,
             "name": self.name,
             "contact_info": self.contact_info,
@@ -93,6 +135,7 @@ class Supplier(ABC):
             "rating": self.rating,
             "location": str(self.location)
         }
+        return self._info_cache
 
     def update_info(self, name=None, contact_info=None, products_supplied=None, rating=None):
         if name:
@@ -103,9 +146,12 @@ class Supplier(ABC):
             self.products_supplied = products_supplied
         if rating:
             self.rating = rating
+        self._info_cache = None
 
 
 class LocalPartsSupplier(Supplier):
+    __slots__ = ("part_type",)
+
     def __init__(self, supplier_id: str, name: str, contact_info: str,
                  location: Location, part_type: str, rating: float = 5):
         products_supplied = [f"Local {part_type} parts"]
@@ -118,6 +164,8 @@ class LocalPartsSupplier(Supplier):
 
 
 class InternationalPartsSupplier(Supplier):
+    __slots__ = ("part_type", "shipping_time_days")
+
     def __init__(self, supplier_id: str, name: str, contact_info: str,
                  location: Location, part_type: str, shipping_time_days: int, rating: float = 4):
         products_supplied = [f"International {part_type} parts"]
@@ -131,6 +179,8 @@ class InternationalPartsSupplier(Supplier):
 
 
 class BatterySupplier(Supplier):
+    __slots__ = ("battery_type",)
+
     def __init__(self, supplier_id: str, name: str, contact_info: str,
                  location: Location, battery_type: str, rating: float = 4):
         products_supplied = [f"{battery_type} batteries"]
@@ -152,6 +202,7 @@ class SupplierManager:
             raise TypeError("Only Supplier instances can be added")
 
         supplier.supplier_id = f"SUP{self.next_id:04d}"
+        supplier._info_cache = None
         self.suppliers[supplier.supplier_id] = supplier
         self.next_id += 1
         return supplier.supplier_id
@@ -166,37 +217,39 @@ class SupplierManager:
         return [supplier.get_info() for supplier in self.suppliers.values()]
 
 
+def _denied(message: str):
+    def deny(*args, **kwargs):
+        print(f"Access denied: {message}")
+    return deny
+
+
 class SupplierManagerProxy:
+    # Roles granted access to the wrapped SupplierManager
+    _ALLOWED_ROLES = frozenset({"admin"})
+    # Method name -> denial message for every other role
+    _GUARDED = {
+        "add_supplier": "Only admins can add suppliers.",
+        "get_supplier": "Only admins can view supplier details.",
+        "remove_supplier": "Only admins can remove suppliers.",
+        "list_suppliers": "Only admins can list suppliers."
+    }
+
     def __init__(self, user_role: str):
         self.user_role = user_role
         self.manager = SupplierManager()
-
-    def add_supplier(self, supplier: Supplier):
-        if self.user_role == "admin":
-            return self.manager.add_supplier(supplier)
-        else:
-            print("Access denied: Only admins can add suppliers.")
-
-    def get_supplier(self, supplier_id: str):
-        if self.user_role == "admin":
-            return self.manager.get_supplier(supplier_id)
-        else:
-            print("Access denied: Only admins can view supplier details.")
-
-    def remove_supplier(self, supplier_id: str):
-        if self.user_role == "admin":
-            return self.manager.remove_supplier(supplier_id)
-        else:
-            print("Access denied: Only admins can remove suppliers.")
-
-    def list_suppliers(self):
-        if self.user_role == "admin":
-            return self.manager.list_suppliers()
-        else:
-            print("Access denied: Only admins can list suppliers.")
+        # The role is fixed for the proxy's lifetime, so resolve each method once here
+        # instead of re-checking the role on every call
+        for method, message in self._GUARDED.items():
+            if user_role in self._ALLOWED_ROLES:
+                setattr(self, method, getattr(self.manager, method))
+            else:
+                setattr(self, method, _denied(message))
 
 
 class Manufacturer:
+    __slots__ = ("manufacturer_id", "name", "location", "production_capacity", "products_produced",
+                 "raw_materials", "_id_counters", "_info_cache")
+
     def __init__(self, manufacturer_id: str, name: str, location: Location, production_capacity: int):
         self.manufacturer_id = manufacturer_id
         self.name = name
@@ -204,6 +257,8 @@ class Manufacturer:
         self.production_capacity = production_capacity
         self.products_produced: List[Product] = []
         self.raw_materials: List[Product] = []
+        self._id_counters: Dict[str, count] = {}  # name prefix -> next product number
+        self._info_cache = None  # scalar fields of get_info(); product lists are read through each Product's cache
 
     def add_raw_material(self, product: Product):
         if not isinstance(product, Product):
@@ -220,7 +275,8 @@ class Manufacturer:
         manufacture_date = date.today()
         expiry_date = manufacture_date + timedelta(days=expiry_days) if expiry_days else None
 
-        product_id = f"{name[:3].upper()}{len(self.products_produced) + 1:04d}"
+        prefix = name[:3].upper()
+        product_id = f"{prefix}{next(self._id_counters.setdefault(prefix, count(1))):04d}"
         new_product = Product(
             product_id=product_id,
             name=name,
@@ -235,12 +291,38 @@ class Manufacturer:
         self.products_produced.append(new_product)
         return new_product
 
+    def manufacture_batch(self, name: str, category: str, price: float, batch_size: int,
+                          quantity: int = 1, warranty_years: int = 1,
+                          expiry_days: Optional[int] = None) -> List[Product]:
+        """Manufacture up to batch_size identical products, sharing the per-call setup"""
+        remaining = self.production_capacity - len(self.products_produced)
+        if batch_size > remaining:
+            print("Production capacity reached!")
+            batch_size = max(remaining, 0)
+
+        manufacture_date = date.today()
+        expiry_date = manufacture_date + timedelta(days=expiry_days) if expiry_days else None
+        prefix = name[:3].upper()
+        ids = self._id_counters.setdefault(prefix, count(1))
+
+        batch = [
+            Product(f"{prefix}{next(ids):04d}", name, category, price, quantity,
+                    manufacture_date, warranty_years, expiry_date)
+            for _ in range(batch_size)
+        ]
+        self.products_produced.extend(batch)
+        return batch
+
     def get_info(self) -> Dict:
+        if self._info_cache is None:
+            self._info_cache = {
+                "manufacturer_id": self.manufacturer_id,
+                "name": self.name,
+                "location": str(self.location),
+                "production_capacity": self.production_capacity
+            }
         return {
-            "manufacturer_id": self.manufacturer_id,
-            "name": self.name,
-            "location": str(self.location),
-            "production_capacity": self.production_capacity,
+            **self._info_cache,
             "products_produced": [p.get_info() for p in self.products_produced],
             "raw_materials": [rm.get_info() for rm in self.raw_materials]
         }
@@ -277,11 +359,15 @@ class StorageUnit(ABC):
         self.__unit_id = unit_id
         self.location = location
         self.capacity = capacity
-        self.inventory = {}
+        self.inventory = Counter()
+        self._total_quantity = 0  # running sum of inventory.values()
 
     def get_unit_id(self):
         return self.__unit_id
 
+    def get_total_quantity(self):
+        return self._total_quantity
+
     @abstractmethod
     def check_inventory(self):
         pass
@@ -289,18 +375,22 @@ class StorageUnit(ABC):
     def store_product(self, product_id, quantity=1):  # Overide
         if quantity <= 0:
             raise ValueError("Quantity must be positive.")
-        total_quantity = sum(self.inventory.values())
-        if total_quantity + quantity > self.capacity:
+        if self._total_quantity + quantity > self.capacity:
             raise Exception("Not enough space in the storage unit.")
         self.inventory[product_id] = self.inventory.get(product_id, 0) + quantity
+        self._total_quantity += quantity
 
     def retrieve_product(self, product_id, quantity=1):
-        if product_id not in self.inventory:
+        current = self.inventory.get(product_id)
+        if current is None:
             raise Exception("Product not found.")
-        if quantity > self.inventory[product_id]:
+        if quantity > current:
             raise Exception("Not enough stock.")
-        self.inventory[product_id] -= quantity
-        if self.inventory[product_id] == 0:
+        remaining = current - quantity
+        self._total_quantity -= quantity
+        if remaining:
+            self.inventory[product_id] = remaining
+        else:
             del self.inventory[product_id]
 
 
@@ -309,20 +399,15 @@ class Warehouse(StorageUnit):
         super().__init__(warehouse_id, location, capacity)
         self._manager_name = manager_name
 
-    @dispatch(str, int)
-    def store_product(self, product_id, quantity=1):
-        """Handle storage by product ID"""
+    def store_product(self, product, quantity=1):
+        """Handle storage by product ID or Product instance"""
+        product_id = product.product_id if isinstance(product, Product) else product
         try:
             super().store_product(product_id, quantity)
             print(f"Stored {quantity} units of product {product_id} in the warehouse.")
         except Exception as e:
             print(f"Error while storing product: {e}")
 
-    @dispatch(Product, int)
-    def store_product(self, product, quantity=1):
-        """Handle storage by Product instance"""
-        self.store_product(product.product_id, quantity)
-
     def retrieve_product(self, product_id, quantity=1):  # Override
         try:
             super().retrieve_product(product_id, quantity)
@@ -330,20 +415,25 @@ class Warehouse(StorageUnit):
         except Exception as e:
             print(f"Error while retrieving product: {e}")
 
-    def check_inventory(self):  # abstract method
+    def _inventory_lines(self):
         if not self.inventory:
-            print("Warehouse inventory is empty.")
-        else:
-            print("Current warehouse inventory:")
-            for product_id, quantity in self.inventory.items():
-                print(f"Product {product_id}: {quantity} units")
+            return ["Warehouse inventory is empty."]
+        lines = ["Current warehouse inventory:"]
+        lines.extend(f"Product {product_id}: {quantity} units" for product_id, quantity in self.inventory.items())
+        return lines
+
+    def check_inventory(self):  # abstract method
+        print("\n".join(self._inventory_lines()))
 
     def get_warehouse_info(self):
-        print(f"Warehouse ID: {self.get_unit_id()}")
-        print(f"Location: {self.location}")
-        print(f"Capacity: {self.capacity}")
-        print(f"Manager: {self._manager_name}")
-        self.check_inventory()
+        lines = [
+            f"Warehouse ID: {self.get_unit_id()}",
+            f"Location: {self.location}",
+            f"Capacity: {self.capacity}",
+            f"Manager: {self._manager_name}"
+        ]
+        lines.extend(self._inventory_lines())
+        print("\n".join(lines))
 
 
 class ExpiryManager:
@@ -354,8 +444,7 @@ class ExpiryManager:
     def is_inventory_full(self):
         if not self.warehouse.inventory:
             return False
-        total_quantity = sum(self.warehouse.inventory.values()) if isinstance(next(iter(self.warehouse.inventory.values())), int) else sum(item['quantity'] for item in self.warehouse.inventory.values())
-        return total_quantity >= self.warehouse.capacity
+        return self.warehouse.get_total_quantity() >= self.warehouse.capacity
 
     def remove_expired_if_full(self):
         if not self.is_inventory_full():
@@ -373,42 +462,46 @@ class ExpiryManager:
         if not removed:
             print("No expired products found.")
 
+    def find_expired(self, products: List[Product]) -> List[Product]:
+        today_ord = self.today_date.toordinal()
+        return [p for p in products if p.is_expired_ord(today_ord)]
+
 
 class Distributor:
     def __init__(self, distributor_id: str, name: str, location: Location):
         self.distributor_id = distributor_id
         self.name = name
         self.location = location
-        self.inventory: List[Product] = []
+        # Products grouped by product_id, oldest first
+        self.inventory: Dict[str, deque] = {}
+        self._count = 0
         self.orders_processed: List['Order'] = []
 
     def add_to_inventory(self, product: Product) -> bool:
         if not isinstance(product, Product):
             raise TypeError("Only Product instances can be added to inventory")
-        self.inventory.append(product)
+        self.inventory.setdefault(product.product_id, deque()).append(product)
+        self._count += 1
         return True
 
     def distribute_product(self, retailer: 'Retailer', product: Product, quantity: int) -> bool:
-        available = sum(1 for p in self.inventory if p.product_id == product.product_id)
-        if available < quantity:
+        products = self.inventory.get(product.product_id, ())
+        if quantity < 0 or len(products) < quantity:
             return False
 
-        distributed = 0
         for _ in range(quantity):
-            for i, p in enumerate(self.inventory):
-                if p.product_id == product.product_id:
-                    retailer.receive_product(self.inventory.pop(i))
-                    distributed += 1
-                    break
-
-        return distributed == quantity
+            retailer.receive_product(products.popleft())
+        self._count -= quantity
+        if not products:
+            self.inventory.pop(product.product_id, None)
+        return True
 
     def get_info(self) -> Dict:
         return {
             "distributor_id": self.distributor_id,
             "name": self.name,
             "location": str(self.location),
-            "inventory_count": len(self.inventory),
+            "inventory_count": self._count,
             "orders_processed": len(self.orders_processed)
         }
 
@@ -440,38 +533,70 @@ class Order:
         return self.__payment_processor.process(self.order_id, total_amount)
 
 
+def _ts_to_dt(ns: int) -> datetime:
+    return datetime.fromtimestamp(ns / 1e9)
+
+
 class PaymentProcessor:
     """Singleton payment processing system"""
     _instance = None
+    _STATUSES = ("completed",)  # status codes stored in the status column
 
     def __new__(cls):
         if not cls._instance:
             cls._instance = super().__new__(cls)
-            cls._instance.__transactions = {}
+            # Transactions are kept column-wise; row i of each column belongs to the same payment
+            cls._instance.__order_index = {}  # order_id -> row
+            cls._instance.__order_ids = []
+            cls._instance.__amounts = array('d')
+            cls._instance.__timestamps = array('q')  # time.time_ns() at processing
+            cls._instance.__statuses = bytearray()
             cls._instance.__total_balance = 0.0
         return cls._instance
 
     def process(self, order_id: str, amount: float) -> bool:
         """Process a payment transaction"""
-        if order_id in self.__transactions:
+        # A single probe both checks for and claims the order id
+        row = len(self.__order_ids)
+        if self.__order_index.setdefault(order_id, row) != row:
             return False  # Prevent duplicate payments
         
         # Simulate actual payment processing
-        self.__transactions[order_id] = {
-            'amount': amount,
-            'timestamp': datetime.now(),
-            'status': 'completed'
-        }
+        self.__order_ids.append(order_id)
+        self.__amounts.append(amount)
+        self.__timestamps.append(time.time_ns())
+        self.__statuses.append(0)
         self.__total_balance += amount
         return True
 
+    def get_transaction(self, order_id: str) -> Optional[Dict]:
+        """Get a single transaction by order id"""
+        row = self.__order_index.get(order_id)
+        if row is None:
+            return None
+        return {
+            'amount': self.__amounts[row],
+            'timestamp': _ts_to_dt(self.__timestamps[row]),
+            'status': self._STATUSES[self.__statuses[row]]
+        }
+
     def get_total_balance(self) -> float:
         """Get cumulative balance of all processed payments"""
         return self.__total_balance
 
     def get_transaction_count(self) -> int:
         """Get total number of processed transactions"""
-        return len(self.__transactions)
+        return len(self.__order_ids)
+
+
+# Reach per budget unit for each campaign strategy; other strategies use the default
+_STRATEGY_MULTIPLIERS = {
+    "Social Media": 75,
+    "TV Ads": 120,
+    "Billboards": 50,
+    "Email Marketing": 40
+}
+_DEFAULT_MULT = 60
 
 
 class Marketing:
@@ -482,14 +607,7 @@ class Marketing:
         self.reach = 0
 
     def run_campaign(self, campaign_name: str, duration_days: int) -> bool:
-        multipliers = {
-            "Social Media": 75,
-            "TV Ads": 120,
-            "Billboards": 50,
-            "Email Marketing": 40
-        }
-
-        multiplier = multipliers.get(self.strategy, 60)
+        multiplier = _STRATEGY_MULTIPLIERS.get(self.strategy, _DEFAULT_MULT)
         self.reach = int(self.budget * multiplier)
 
         campaign = {
@@ -528,27 +646,38 @@ class Store(ABC):
         self.store_id = store_id
         self.name = name
         self.location = location
-        self.inventory: List[Product] = []
+        # Products grouped by product_id, oldest first; running totals keep get_info O(1)
+        self.inventory: Dict[str, deque] = {}
+        self._count = 0
+        self._value_sum = 0
 
     def add_product(self, product: Product) -> bool:
         if not isinstance(product, Product):
             raise TypeError("Only Product instances can be added")
-        self.inventory.append(product)
+        self.inventory.setdefault(product.product_id, deque()).append(product)
+        self._count += 1
+        self._value_sum += product.price
         return True
 
     def sell_product(self, product_id: str) -> Optional[Product]:
-        for i, product in enumerate(self.inventory):
-            if product.product_id == product_id:
-                return self.inventory.pop(i)
-        return None
+        products = self.inventory.get(product_id)
+        if not products:
+            return None
+        product = products.popleft()
+        if not products:
+            del self.inventory[product_id]
+        self._count -= 1
+        # Reset on empty so rounding left over from the running float total can't linger
+        self._value_sum = self._value_sum - product.price if self._count else 0
+        return product
 
     def get_info(self) -> Dict:
         return {
             "store_id": self.store_id,
             "name": self.name,
             "location": str(self.location),
-            "inventory_count": len(self.inventory),
-            "inventory_value": sum(p.price for p in self.inventory)
+            "inventory_count": self._count,
+            "inventory_value": self._value_sum
         }
 
 
@@ -589,7 +718,7 @@ class CarStore(Store):
         self.test_drives = 0
 
     def arrange_test_drive(self) -> bool:
-        if len(self.inventory) == 0:
+        if self._count == 0:
             return False
         self.test_drives += 1
         return True
@@ -615,29 +744,35 @@ class SupplyChain:
         self.stores: Dict[str, Store] = {}
         self.warehouses: Dict[str, Warehouse] = {}
         self.products: Dict[str, Product] = {}
+        # Monotonic id sequences, so ids are never reused after an entity is removed
+        self._manufacturer_ids = count(1)
+        self._distributor_ids = count(1)
+        self._retailer_ids = count(1)
+        self._store_ids = count(1)
+        self._warehouse_ids = count(1)
 
     def add_manufacturer(self, name: str, location: Location, capacity: int) -> str:
-        manufacturer_id = f"MAN{len(self.manufacturers) + 1:04d}"
+        manufacturer_id = f"MAN{next(self._manufacturer_ids):04d}"
         self.manufacturers[manufacturer_id] = Manufacturer(manufacturer_id, name, location, capacity)
         return manufacturer_id
 
     def add_distributor(self, name: str, location: Location) -> str:
-        distributor_id = f"DIST{len(self.distributors) + 1:04d}"
+        distributor_id = f"DIST{next(self._distributor_ids):04d}"
         self.distributors[distributor_id] = Distributor(distributor_id, name, location)
         return distributor_id
 
     def add_retailer(self, name: str, location: Location) -> str:
-        retailer_id = f"RET{len(self.retailers) + 1:04d}"
+        retailer_id = f"RET{next(self._retailer_ids):04d}"
         self.retailers[retailer_id] = Retailer(retailer_id, name, location)
         return retailer_id
 
     def add_car_store(self, name: str, location: Location, brand: str) -> str:
-        store_id = f"CAR{len(self.stores) + 1:04d}"
+        store_id = f"CAR{next(self._store_ids):04d}"
         self.stores[store_id] = CarStore(store_id, name, location, brand)
         return store_id
 
     def add_warehouse(self, location: Location, capacity: int, manager: str = None) -> str:
-        warehouse_id = f"WH{len(self.warehouses) + 1:04d}"
+        warehouse_id = f"WH{next(self._warehouse_ids):04d}"
         self.warehouses[warehouse_id] = Warehouse(warehouse_id, location, capacity, manager)
         return warehouse_id
 
@@ -653,8 +788,56 @@ class SupplyChain:
         }
 
 
+class _SQLitePool:
+    """Bounded pool of long-lived connections so the page cache stays warm"""
+
+    def __init__(self, factory, size: int = 4):
+        # Connections are opened on first demand, so a single-threaded session only ever opens one
+        self._factory = factory
+        self._size = size
+        self._opened = 0
+        self._lock = threading.Lock()
+        self._connections = queue.Queue(maxsize=size)
+
+    def acquire(self) -> sqlite3.Connection:
+        try:
+            return self._connections.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._opened < self._size:
+                self._opened += 1
+                return self._factory()
+        return self._connections.get()
+
+    def release(self, connection: sqlite3.Connection):
+        self._connections.put(connection)
+
+    @contextmanager
+    def connection(self):
+        connection = self.acquire()
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def close(self):
+        while not self._connections.empty():
+            self._connections.get_nowait().close()
+            self._opened -= 1
+
+
 class User:
     current_user = None
+    _pool = None
+    # Statement texts live on the class so every call hands sqlite3 the same string
+    _INSERT_USER_SQL = "INSERT INTO users (username, name, role, email, password) VALUES (?, ?, ?, ?, ?)"
+    _SELECT_USERS_SQL = "SELECT * FROM users"
+    _UPDATE_EMAIL_SQL = "UPDATE users SET email = ? WHERE id = ?"
+    _DELETE_USER_SQL = "DELETE FROM users WHERE id = ?"
+    _UPDATE_PASSWORD_SQL = "UPDATE users SET password = ? WHERE id = ?"
+    _SALT_BYTES = 16
+    _DIGEST_BYTES = 64
 
     def __init__(self, id=None, username=None, name=None, role=None, email=None, password=None):
         self.id = id
@@ -667,11 +850,59 @@ class User:
     @classmethod
     def get_connection(cls, db_name):
         try: 
-            return sqlite3.connect(db_name)
+            # Autocommit mode: multi-statement work opens its own BEGIN explicitly
+            uri = f"{Path(db_name).resolve().as_uri()}?mode=rwc"
+            connection = sqlite3.connect(uri, uri=True, cached_statements=256, isolation_level=None,
+                                         check_same_thread=False)
+            connection.executescript(
+                "PRAGMA journal_mode=WAL;"
+                "PRAGMA synchronous=NORMAL;"
+                "PRAGMA temp_store=MEMORY;"
+                "PRAGMA cache_size=-65536;"
+                "PRAGMA mmap_size=268435456;"
+            )
+            return connection
         except Exception as e: 
             print(f"exception1 {e}")
             raise
 
+    @classmethod
+    def get_pool(cls, db_name="database3.db") -> _SQLitePool:
+        if cls._pool is None:
+            cls._pool = _SQLitePool(lambda: cls.get_connection(db_name))
+        return cls._pool
+
+    @classmethod
+    def get_pooled_connection(cls, db_name="database3.db"):
+        return cls.get_pool(db_name).connection()
+
+    @classmethod
+    def close_pool(cls):
+        if cls._pool is not None:
+            cls._pool.close()
+            cls._pool = None
+
+    @classmethod
+    def hash_password(cls, password: str, salt: bytes = None) -> str:
+        salt = salt or os.urandom(cls._SALT_BYTES)
+        digest = hashlib.scrypt(password.encode(), salt=salt, n=2**14, r=8, p=1)
+        return base64.b64encode(salt + digest).decode()
+
+    @classmethod
+    def is_hashed(cls, stored: str) -> bool:
+        try:
+            return len(base64.b64decode(stored, validate=True)) == cls._SALT_BYTES + cls._DIGEST_BYTES
+        except ValueError:
+            return False
+
+    @classmethod
+    def verify_password(cls, password: str, stored: str) -> bool:
+        if not cls.is_hashed(stored):
+            # Rows written before passwords were hashed still hold the plaintext
+            return hmac.compare_digest(password.encode(), stored.encode())
+        salt = base64.b64decode(stored)[:cls._SALT_BYTES]
+        return hmac.compare_digest(cls.hash_password(password, salt), stored)
+
     @classmethod
     def create_table(cls, connection):
         query = """
@@ -696,7 +927,7 @@ class User:
         print("\n--- Register New User ---")
         username = input("Enter username: ")
 
-        existing = cls.fetch_users(connection, f"username = '{username}'")
+        existing = cls.fetch_users(connection, "username = ?", (username,))
         if existing:
             print("Username already exists!")
             return
@@ -711,13 +942,9 @@ class User:
             print("Passwords don't match!")
             return
 
-        max_id = connection.execute("SELECT MAX(id) FROM users").fetchone()[0]
-        new_id = 1 if max_id is None else max_id + 1
-
-        query = "INSERT INTO users (id, username, name, role, email, password) VALUES (?, ?, ?, ?, ?, ?)"
         try: 
             with connection:
-                connection.execute(query, (new_id, username, name, role, email, password))
+                connection.execute(cls._INSERT_USER_SQL, (username, name, role, email, cls.hash_password(password)))
                 print(f"User {username} registered successfully!")
         except Exception as e:
             print(f"Registration failed: {e}")
@@ -728,8 +955,12 @@ class User:
         username = input("Username: ")
         password = input("Password: ")
 
-        user = cls.fetch_users(connection, f"username = '{username}' AND password = '{password}'")
-        if user:
+        user = cls.fetch_users(connection, "username = ?", (username,))
+        if user and cls.verify_password(password, user[0][5]):
+            if not cls.is_hashed(user[0][5]):
+                # Upgrade a legacy plaintext password now that we have it
+                with connection:
+                    connection.execute(cls._UPDATE_PASSWORD_SQL, (cls.hash_password(password), user[0][0]))
             cls.current_user = cls(*user[0])  # Create User instance
             print(f"Welcome {cls.current_user.name} ({cls.current_user.role})!")
             cls.current_user.do_role_action()
@@ -771,25 +1002,24 @@ class User:
         if not cls.check_login('admin'):
             return
 
-        query = "INSERT INTO users (username, name, role, email, password) VALUES (?, ?, ?, ?, ?)"
         try: 
             username = email.split('@')[0]
-            password = "default123"
+            password = cls.hash_password("default123")
             with connection:
-                connection.execute(query, (username, name, role, email, password))
+                connection.execute(cls._INSERT_USER_SQL, (username, name, role, email, password))
                 print(f"User {name} was added")
         except Exception as e:
             print(f"exception3 {e}")
 
     @classmethod
-    def fetch_users(cls, connection, condition: str = None):
-        query = "SELECT * FROM users"
-        if condition:
-            query += f" WHERE {condition}"
+    def fetch_users(cls, connection, where: str = None, params: tuple = ()):
+        query = cls._SELECT_USERS_SQL
+        if where:
+            query += f" WHERE {where}"
 
         try:
             with connection:
-                rows = connection.execute(query).fetchall()
+                rows = connection.execute(query, params).fetchall()
             return rows    
         except Exception as e:
             print(f"exception 4 {e}")
@@ -800,10 +1030,9 @@ class User:
         if not cls.check_login('admin'):
             return
 
-        query = "DELETE FROM users WHERE id = ?"
         try: 
             with connection:
-                connection.execute(query, (id,))
+                connection.execute(cls._DELETE_USER_SQL, (id,))
             print(f"user: {id} deleted.")
         except Exception as e:
             print(f"exception 5 {e}")
@@ -813,36 +1042,96 @@ class User:
         if not cls.check_login():
             return
 
-        query = "UPDATE users SET email = ? WHERE id = ?"
         try: 
             with connection:
-                connection.execute(query, (email, id))
+                connection.execute(cls._UPDATE_EMAIL_SQL, (email, id))
             print("User email updated")
         except Exception as e:
             print(f"exception 6 {e}") 
 
+    @classmethod
+    def _prepare_row(cls, user):
+        name, role, email = user
+        return (email.split('@')[0], name, role, email, cls.hash_password("default123"))
+
     @classmethod
     def insert_many_users(cls, connection, users):
         if not cls.check_login('admin'):
             return
 
-        query = "INSERT INTO users (username, name, role, email, password) VALUES (?, ?, ?, ?, ?)"
-        try: 
-            with connection:
-                processed_users = []
-                for name, role, email in users:
-                    username = email.split('@')[0]
-                    password = "default123"
-                    processed_users.append((username, name, role, email, password))
-
-                connection.executemany(query, processed_users)
-            print(f"{len(users)} users were added")
-        except Exception as e:
-            print(f"exception 7 {e}")
+        # scrypt releases the GIL, so the per-user password hashes can run in parallel;
+        # executemany consumes the rows as they are hashed instead of waiting for a full list
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            try:
+                # One explicit transaction so the whole batch is synced to disk once
+                connection.execute("BEGIN")
+                connection.executemany(cls._INSERT_USER_SQL, executor.map(cls._prepare_row, users))
+                connection.commit()
+                print(f"{len(users)} users were added")
+            except Exception as e:
+                connection.rollback()
+                print(f"exception 7 {e}")
+
+    @classmethod
+    def _prompt_logout(cls, connection):
+        cls.logout()
+
+    @classmethod
+    def _prompt_add_user(cls, connection):
+        name = input("Enter name: ")
+        role = input("Enter role: ")
+        email = input("Enter email: ")
+        cls.insert_user(connection, name, role, email)
+
+    @classmethod
+    def _prompt_search_users(cls, connection):
+        for user in cls.fetch_users(connection):
+            print(user)
+
+    @classmethod
+    def _prompt_update_email(cls, connection):
+        id = int(input("Enter user ID to update: "))
+        email = input("Enter new email: ")
+        cls.update_user(connection, id, email)
+
+    @classmethod
+    def _prompt_delete_user(cls, connection):
+        id = int(input("Enter user ID to delete: "))
+        cls.delete_user(connection, id)
+
+    @classmethod
+    def _prompt_add_many_users(cls, connection):
+        users = []
+        while True:
+            name = input("Enter name (or 'done' to finish): ")
+            if name.lower() == 'done':
+                break
+            role = input("Enter role: ")
+            email = input("Enter email: ")
+            users.append((name, role, email))
+        if users:
+            cls.insert_many_users(connection, users)
 
     @classmethod
     def main(cls):
-        connection = cls.get_connection("database3.db")
+        # Menu choice -> handler taking the connection; None exits the loop
+        auth_actions = {
+            "1": cls._prompt_logout,
+            "2": cls._prompt_add_user,
+            "3": cls._prompt_search_users,
+            "4": cls._prompt_update_email,
+            "5": cls._prompt_delete_user,
+            "6": cls._prompt_add_many_users,
+            "7": None
+        }
+        anon_actions = {
+            "1": cls.login,
+            "2": cls.register_user,
+            "3": None
+        }
+
+        pool = cls.get_pool("database3.db")
+        connection = pool.acquire()
         cls.create_table(connection)
 
         while True:
@@ -862,49 +1151,19 @@ class User:
 
             choice = input("Enter your choice: ")
 
-            if cls.current_user:
-                if choice == "1":
-                    cls.logout()
-                elif choice == "2":
-                    name = input("Enter name: ")
-                    role = input("Enter role: ")
-                    email = input("Enter email: ")
-                    cls.insert_user(connection, name, role, email)
-                elif choice == "3":
-                    for user in cls.fetch_users(connection):
-                        print(user)
-                elif choice == "4":
-                    id = int(input("Enter user ID to update: "))
-                    email = input("Enter new email: ")
-                    cls.update_user(connection, id, email)
-                elif choice == "5":
-                    id = int(input("Enter user ID to delete: "))
-                    cls.delete_user(connection, id)
-                elif choice == "6":
-                    users = []
-                    while True:
-                        name = input("Enter name (or 'done' to finish): ")
-                        if name.lower() == 'done':
-                            break
-                        role = input("Enter role: ")
-                        email = input("Enter email: ")
-                        users.append((name, role, email))
-                    if users:
-                        cls.insert_many_users(connection, users)
-                elif choice == "7":
-                    break
-            else:
-                if choice == "1":
-                    cls.login(connection)
-                elif choice == "2":
-                    cls.register_user(connection)
-                elif choice == "3":
-                    break
+            actions = auth_actions if cls.current_user else anon_actions
+            if choice not in actions:
+                continue
+            action = actions[choice]
+            if action is None:
+                break
+            action(connection)
 
-        connection.close()
+        pool.release(connection)
+        cls.close_pool()
 
 
-if __name__ == "__main__":
+def _run_demo():
     # Create locations
     ny_location = Location("123 Main St", "New York", "USA", "10001")
     la_location = Location("456 Sunset Blvd", "Los Angeles", "USA", "90028")
@@ -1169,5 +1428,15 @@ if __name__ == "__main__":
     print("\n=== Supply Chain Status ===")
     print(supply_chain.get_supply_chain_status())
 
-    # Run the user management system
-    User.main()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Supply chain management system")
+    parser.add_argument("--demo", action="store_true", help="only run the supply chain demo")
+    parser.add_argument("--user-mgmt", action="store_true", help="only run the user management system")
+    args = parser.parse_args()
+
+    # With neither flag, run the demo followed by user management as before
+    if not args.user_mgmt:
+        _run_demo()
+    if not args.demo:
+        User.main()
@@ -1,60 +1,100 @@
+from __future__ import annotations
+
+__all__ = ["Product", "Manufacturer", "Maintenance"]
+
+
 class Product:
-    def init(self, product_id, name, category, price, quantity, manufacture_date, warranty_years):
+    __slots__ = ("product_id", "name", "category", "price", "_quantity", "manufacture_date", "warranty_years",
+                 "_info_cache", "_version", "_owner")
+
+    def __init__(self, product_id, name, category, price, quantity, manufacture_date, warranty_years):
         self.product_id = product_id
         self.name = name
         self.category = category
         self.price = price
-        self.quantity = quantity
+        self._quantity = quantity
         self.manufacture_date = manufacture_date
         self.warranty_years = warranty_years
+        self._info_cache = None
+        self._version = 0  # bumped on every mutation so holders of our info can tell it changed
+        self._owner = None  # Manufacturer that produced us, told about each mutation
+
+    @property
+    def quantity(self):
+        return self._quantity
 
     def update_quantity(self, amount):
-        self.quantity += amount
+        self._quantity += amount
+        self._version += 1
+        self._info_cache = None
+        if self._owner is not None:
+            self._owner._products_version += 1
 
     def get_info(self):
-        return {
+        if self._info_cache is not None:
+            return self._info_cache
+        self._info_cache = {
             "Product ID": self.product_id,
             "Name": self.name,
             "Category": self.category,
             "Price": self.price,
-            "Quantity": self.quantity,
+            "Quantity": self._quantity,
             "Manufacture Date": self.manufacture_date,
             "Warranty (Years)": self.warranty_years
         }
+        return self._info_cache
 
 class Manufacturer:
-    def init(self, manufacturer_id, name, production_capacity):
+    def __init__(self, manufacturer_id, name, production_capacity):
         self.manufacturer_id = manufacturer_id
         self.name = name
-        self.raw_materials = []
-        self.products_produced = []
+        # Keyed by product_id
+        self.raw_materials = {}
+        self.products_produced = {}
         self.production_capacity = production_capacity
         self.product_counter = 0
+        self._prefix_cache = {}  # product name -> id prefix
+        self._products_version = 0  # bumped by our products on every mutation
+        self._products_info = None
+        self._products_info_key = None  # (count, _products_version) _products_info was built for
 
     def add_raw_material(self, product):
-        self.raw_materials.append(product)
+        # Keyed by id, so a second material with the same id would silently replace the first
+        if product.product_id in self.raw_materials:
+            print(f"Raw material {product.product_id} is already registered!")
+            return
+        self.raw_materials[product.product_id] = product
 
     def manufacture_product(self, product_name, category, price, quantity=1, manufacture_date=None, warranty_years=0):
-        if self.product_counter < self.production_capacity:
+        if len(self.products_produced) < self.production_capacity:
             self.product_counter += 1
-            product_id = f"{product_name[:3].upper()}{self.product_counter}"
+            prefix = self._prefix_cache.get(product_name)
+            if prefix is None:
+                prefix = product_name[:3].upper()
+                self._prefix_cache[product_name] = prefix
+            product_id = f"{prefix}{self.product_counter}"
             new_product = Product(product_id, product_name, category, price, quantity, manufacture_date, warranty_years)
-            self.products_produced.append(new_product)
+            new_product._owner = self
+            self.products_produced[product_id] = new_product
             return new_product
         else:
             print("Production capacity reached!")
             return None
 
     def get_manufacturer_info(self):
+        key = (len(self.products_produced), self._products_version)
+        if key != self._products_info_key:
+            self._products_info = [p.get_info() for p in self.products_produced.values()]
+            self._products_info_key = key
         return {
             "Manufacturer ID": self.manufacturer_id,
             "Name": self.name,
             "Production Capacity": self.production_capacity,
-            "Products Produced": [p.get_info() for p in self.products_produced]
+            "Products Produced": self._products_info
         }
 
 class Maintenance:
-    def init(self, maintenance_id, product, date, service_type, service_details, cost, parts_replaced=None):
+    def __init__(self, maintenance_id, product, date, service_type, service_details, cost, parts_replaced=None):
         self.maintenance_id = maintenance_id
         self.product = product
         self.date = date
@@ -62,9 +102,13 @@ class Maintenance:
         self.service_details = service_details
         self.cost = cost
         self.parts_replaced = parts_replaced if parts_replaced else []
+        self._record_cache = None
 
     def get_maintenance_record(self):
-        return {
+        # A maintenance record is written once, so the dict is built on first use and reused
+        if self._record_cache is not None:
+            return self._record_cache
+        self._record_cache = {
             "Maintenance ID": self.maintenance_id,
             "Car ID": self.product.product_id,
             "Car Name": self.product.name,
@@ -74,6 +118,7 @@ class Maintenance:
             "Cost": self.cost,
             "Parts Replaced": self.parts_replaced
         }
+        return self._record_cache
 
-    def str(self):
+    def __str__(self):
         return f"[{self.date}] {self.product.name} - {self.service_type}: ${self.cost}"
@@ -0,0 +1,73 @@
+import contextlib
+import importlib.util
+import io
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+
+_spec = importlib.util.spec_from_file_location(
+    "warehouse_expiry", Path(__file__).resolve().parent.parent / "warehouse and ExpiryManager.py"
+)
+warehouse_expiry = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(warehouse_expiry)
+
+TODAY = date(2024, 6, 1)
+PAST = TODAY - timedelta(days=5)
+FUTURE = TODAY + timedelta(days=5)
+
+
+class WarehouseExpiryTest(unittest.TestCase):
+    def setUp(self):
+        self.warehouse = warehouse_expiry.Warehouse("W1", "Cairo", 10)
+        self.manager = warehouse_expiry.ExpiryManager(self.warehouse, TODAY)
+
+    def sweep(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.manager.remove_expired_if_full()
+
+    # StorageUnit's methods raise where the Warehouse overrides only print
+    def store(self, product_id, quantity, expiry=None):
+        warehouse_expiry.StorageUnit.store_product(self.warehouse, product_id, quantity, expiry)
+
+    def retrieve(self, product_id, quantity):
+        warehouse_expiry.StorageUnit.retrieve_product(self.warehouse, product_id, quantity)
+
+    def test_restock_without_expiry_survives_sweep(self):
+        self.store("P1", 2, PAST)
+        self.retrieve("P1", 2)
+        self.store("P1", 10)
+        self.sweep()
+        self.assertEqual(self.warehouse.inventory_snapshot(), {"P1": 10})
+
+    def test_sweep_removes_only_expired_lot(self):
+        self.store("P1", 4, PAST)
+        self.store("P1", 3, FUTURE)
+        self.store("P2", 3)
+        self.sweep()
+        self.assertEqual(self.warehouse.inventory_snapshot(), {"P1": 3, "P2": 3})
+        self.assertEqual(self.warehouse.get_total_quantity(), 6)
+
+    def test_retrieve_takes_earliest_expiry_first(self):
+        self.store("P1", 4, PAST)
+        self.store("P1", 6, FUTURE)
+        self.retrieve("P1", 4)
+        self.store("P2", 4)
+        self.sweep()
+        self.assertEqual(self.warehouse.inventory_snapshot(), {"P1": 6, "P2": 4})
+
+    def test_mixed_id_types_with_same_expiry(self):
+        self.store("P1", 5, PAST)
+        self.store(7, 5, PAST)
+        self.sweep()
+        self.assertEqual(self.warehouse.inventory_snapshot(), {})
+        self.assertEqual(self.warehouse.get_total_quantity(), 0)
+
+    def test_bad_expiry_leaves_stock_untouched(self):
+        with self.assertRaises(AttributeError):
+            self.store("P1", 5, "2024-01-01")
+        self.assertEqual(self.warehouse.inventory_snapshot(), {})
+        self.assertEqual(self.warehouse.get_total_quantity(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
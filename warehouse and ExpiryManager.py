@@ -1,35 +1,139 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left, insort
+from datetime import date
+from itertools import count
+
+__all__ = ["StorageUnit", "Warehouse", "ExpiryManager"]
+
 
 class StorageUnit(ABC):
     def __init__(self, unit_id, location, capacity):
         self.__unit_id = unit_id  
         self.location = location
         self.capacity = capacity
-        self.inventory = {}
+        # Stock is kept column-wise: _ids[i] holds _qty[i] units, and _slot maps product_id -> i
+        self._slot = {}
+        self._ids = []
+        self._qty = array('q')
+        self._total_quantity = 0  # running sum of _qty
+        # Stock stored with an expiry date is tracked per lot; _by_expiry holds one entry per lot, kept sorted
+        self._lots = {}  # product_id -> {expiry ordinal: [quantity, seq]}
+        self._by_expiry = []  # (expiry ordinal, seq, product_id); the unique seq keeps product ids out of comparisons
+        self._lot_seq = count()
+
+    def inventory_snapshot(self):
+        """Copy of the stock as {product_id: quantity}; changes to it do not reach the unit"""
+        return dict(zip(self._ids, self._qty))
 
     def get_unit_id(self):
         return self.__unit_id
 
+    def get_total_quantity(self):
+        return self._total_quantity
+
     @abstractmethod
     def check_inventory(self):
         pass
 
-    def store_product(self, product_id, quantity=1):  # Overide
+    def _add(self, product_id, quantity):
+        slot = self._slot.get(product_id)
+        if slot is None:
+            self._slot[product_id] = len(self._ids)
+            self._ids.append(product_id)
+            self._qty.append(quantity)
+        else:
+            self._qty[slot] += quantity
+
+    def _drop(self, product_id):
+        # Move the last row into the freed slot so the columns stay dense
+        slot = self._slot.pop(product_id)
+        last_id = self._ids.pop()
+        last_qty = self._qty.pop()
+        if last_id != product_id:
+            self._ids[slot] = last_id
+            self._qty[slot] = last_qty
+            self._slot[last_id] = slot
+
+    def _take_from_lots(self, product_id, quantity):
+        # Dated stock leaves earliest expiry first; whatever is left comes from undated stock
+        lots = self._lots.get(product_id)
+        if not lots:
+            return
+        for expiry_ord in sorted(lots):
+            if not quantity:
+                break
+            lot = lots[expiry_ord]
+            taken = min(quantity, lot[0])
+            lot[0] -= taken
+            quantity -= taken
+            if not lot[0]:
+                del self._by_expiry[bisect_left(self._by_expiry, (expiry_ord, lot[1]))]
+                del lots[expiry_ord]
+        if not lots:
+            del self._lots[product_id]
+
+    def store_product(self, product_id, quantity=1, expiry=None):  # Overide
         if quantity <= 0:
             raise ValueError("Quantity must be positive.")
-        total_quantity = sum(self.inventory.values())
-        if total_quantity + quantity > self.capacity:
+        if self._total_quantity + quantity > self.capacity:
+            raise Exception("Not enough space in the storage unit.")
+        # Index the lot first so a bad expiry leaves the stock untouched
+        if expiry is not None:
+            expiry_ord = expiry.toordinal()
+            lot = self._lots.get(product_id, {}).get(expiry_ord)
+            if lot is None:
+                seq = next(self._lot_seq)
+                insort(self._by_expiry, (expiry_ord, seq, product_id))
+                self._lots.setdefault(product_id, {})[expiry_ord] = [quantity, seq]
+            else:
+                lot[0] += quantity
+        self._add(product_id, quantity)
+        self._total_quantity += quantity
+
+    def remove_expired(self, today):
+        """Remove every lot that expired before today, found by bisection; returns the affected product ids"""
+        cut = bisect_left(self._by_expiry, (today.toordinal(),))
+        expired = self._by_expiry[:cut]
+        del self._by_expiry[:cut]
+        removed = {}
+        for expiry_ord, _, product_id in expired:
+            lots = self._lots[product_id]
+            quantity = lots.pop(expiry_ord)[0]
+            if not lots:
+                del self._lots[product_id]
+            slot = self._slot[product_id]
+            self._qty[slot] -= quantity
+            self._total_quantity -= quantity
+            if not self._qty[slot]:
+                self._drop(product_id)
+            removed[product_id] = None
+        return list(removed)
+
+    def store_products(self, products):
+        # Validate and check capacity once for the whole batch, then apply every line
+        if any(quantity <= 0 for quantity in products.values()):
+            raise ValueError("Quantity must be positive.")
+        batch_quantity = sum(products.values())
+        if self._total_quantity + batch_quantity > self.capacity:
             raise Exception("Not enough space in the storage unit.")
-        self.inventory[product_id] = self.inventory.get(product_id, 0) + quantity
+        for product_id, quantity in products.items():
+            self._add(product_id, quantity)
+        self._total_quantity += batch_quantity
 
     def retrieve_product(self, product_id, quantity=1):
-        if product_id not in self.inventory:
+        slot = self._slot.get(product_id)
+        if slot is None:
             raise Exception("Product not found.")
-        if quantity > self.inventory[product_id]:
+        if quantity > self._qty[slot]:
             raise Exception("Not enough stock.")
-        self.inventory[product_id] -= quantity
-        if self.inventory[product_id] == 0:
-            del self.inventory[product_id]
+        self._take_from_lots(product_id, quantity)
+        self._qty[slot] -= quantity
+        self._total_quantity -= quantity
+        if self._qty[slot] == 0:
+            self._drop(product_id)
 
 
 class Warehouse(StorageUnit):
@@ -37,13 +141,20 @@ class Warehouse(StorageUnit):
         super().__init__(warehouse_id, location, capacity)
         self._manager_name = manager_name
 
-    def store_product(self, product_id, quantity=1):  # Override
+    def store_product(self, product_id, quantity=1, expiry=None):  # Override
         try:
-            super().store_product(product_id, quantity)
+            super().store_product(product_id, quantity, expiry)
             print(f"Stored {quantity} units of product {product_id} in the warehouse.")
         except Exception as e:
             print(f"Error while storing product: {e}")
 
+    def store_products(self, products):  # Override
+        try:
+            super().store_products(products)
+            print(f"Stored {sum(products.values())} units across {len(products)} products in the warehouse.")
+        except Exception as e:
+            print(f"Error while storing products: {e}")
+
     def retrieve_product(self, product_id, quantity=1):  # Override
         try:
             super().retrieve_product(product_id, quantity)
@@ -51,47 +162,44 @@ class Warehouse(StorageUnit):
         except Exception as e:
             print(f"Error while retrieving product: {e}")
 
+    def _inventory_lines(self):
+        if not self._ids:
+            return ["Warehouse inventory is empty."]
+        lines = ["Current warehouse inventory:"]
+        lines.extend(f"Product {product_id}: {quantity} units" for product_id, quantity in zip(self._ids, self._qty))
+        return lines
+
     def check_inventory(self):  # abstract method
-        if not self.inventory:
-            print("Warehouse inventory is empty.")
-        else:
-            print("Current warehouse inventory:")
-            for product_id, quantity in self.inventory.items():
-                print(f"Product {product_id}: {quantity} units")
+        print("\n".join(self._inventory_lines()))
 
     def get_warehouse_info(self):
-        print(f"Warehouse ID: {self.get_unit_id()}")
-        print(f"Location: {self.location}")
-        print(f"Capacity: {self.capacity}")
-        print(f"Manager: {self._manager_name}")
-        self.check_inventory()
+        lines = [
+            f"Warehouse ID: {self.get_unit_id()}",
+            f"Location: {self.location}",
+            f"Capacity: {self.capacity}",
+            f"Manager: {self._manager_name}"
+        ]
+        lines.extend(self._inventory_lines())
+        print("\n".join(lines))
 
 
 class ExpiryManager:
-    def __init__(self, warehouse):
+    def __init__(self, warehouse, today_date=None):
         self.warehouse = warehouse
+        self.today_date = today_date  # None means "the current date at each sweep"
 
     def is_inventory_full(self):
-        total_quantity = sum([item['quantity'] for item in self.warehouse.inventory.values()])
-        return total_quantity >= self.warehouse.capacity
-
-    def remove_expired_if_full(self):
-        if not self.is_inventory_full():
-            print("Inventory is not full. No expired items removed.")
-            return
+        return self.warehouse.get_total_quantity() >= self.warehouse.capacity
 
     def remove_expired_if_full(self):
+        # Expired stock is only reaped once the warehouse runs out of space
         if not self.is_inventory_full():
             print("Inventory is not full. No expired items removed.")
             return
 
-        removed = False
-        for product_id in list(self.warehouse.inventory.keys()):
-            expiry = self.warehouse.inventory[product_id]['expiry']
-            if expiry < self.today_date: 
-                del self.warehouse.inventory[product_id]
-                print(f"Removed expired product: {product_id}")
-                removed = True
+        expired = self.warehouse.remove_expired(self.today_date or date.today())
+        for product_id in expired:
+            print(f"Removed expired product: {product_id}")
 
-        if not removed:
+        if not expired:
             print("No expired products found.")